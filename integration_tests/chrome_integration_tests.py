@@ -32,7 +32,6 @@ Run with: pytest chrome_integration_tests.py -v -s
 """
 
 import pytest
-import time
 import os
 import sys
 
@@ -118,8 +117,6 @@ class TestBloggyChromeLive:
         print("   → Resizing to iPhone SE (375x667)...")
         # mcp_chrome-devtools_resize_page(width=375, height=667)
         
-        time.sleep(0.5)  # Wait for layout adjustment
-        
         # Take screenshot
         print("   → Taking mobile screenshot...")
         # mcp_chrome-devtools_take_screenshot(
@@ -137,8 +134,6 @@ class TestBloggyChromeLive:
         print("   → Resizing to iPad (768x1024)...")
         # mcp_chrome-devtools_resize_page(width=768, height=1024)
         
-        time.sleep(0.5)
-        
         # Take screenshot
         print("   → Taking tablet screenshot...")
         # mcp_chrome-devtools_take_screenshot(
@@ -156,8 +151,6 @@ class TestBloggyChromeLive:
         print("   → Resizing to Desktop (1920x1080)...")
         # mcp_chrome-devtools_resize_page(width=1920, height=1080)
         
-        time.sleep(0.5)
-        
         # Take screenshot
         print("   → Taking desktop screenshot...")
         # mcp_chrome-devtools_take_screenshot(
@@ -176,8 +169,6 @@ class TestBloggyChromeLive:
         print(f"   → Navigating to {auth_url}...")
         # mcp_chrome-devtools_navigate_page(url=auth_url)
         
-        time.sleep(1)
-        
         # Take snapshot
         print("   → Verifying auth page elements...")
         # snapshot = mcp_chrome-devtools_take_snapshot()
@@ -214,8 +205,6 @@ class TestBloggyChromeLive:
         print(f"   → Loading {self.BASE_URL}...")
         # mcp_chrome-devtools_navigate_page(url=self.BASE_URL)
         
-        time.sleep(2)
-        
         # Get network requests
         print("   → Fetching network requests...")
         # requests = mcp_chrome-devtools_list_network_requests()
@@ -236,8 +225,6 @@ class TestBloggyChromeLive:
         print("   → Starting performance trace...")
         # mcp_chrome-devtools_performance_start_trace(reload=True, autoStop=True)
         
-        time.sleep(3)
-        
         # Stop trace and get metrics
         print("   → Collecting metrics...")
         # mcp_chrome-devtools_performance_stop_trace()
@@ -265,8 +252,6 @@ class TestBloggyChromeLive:
             
             # Navigate
             # mcp_chrome-devtools_navigate_page(url=url)
-            time.sleep(1)
-            
             # Screenshot
             # mcp_chrome-devtools_take_screenshot(
             #     filePath=f'screenshots/{name}.png',
@@ -300,8 +285,6 @@ class TestBloggyChromeLiveInteractions:
         print(f"   → Navigating to {login_url}...")
         # mcp_chrome-devtools_navigate_page(url=login_url)
         
-        time.sleep(1)
-        
         # Take snapshot to get form element UIDs
         print("   → Getting form elements...")
         # snapshot = mcp_chrome-devtools_take_snapshot()
@@ -317,8 +300,6 @@ class TestBloggyChromeLiveInteractions:
         print("   → Submitting form...")
         # mcp_chrome-devtools_click(uid='submit_button_uid')
         
-        time.sleep(2)
-        
         # Wait for redirect
         print("   → Waiting for redirect...")
         # mcp_chrome-devtools_wait_for(text='Create New Post')
@@ -342,8 +323,6 @@ class TestBloggyChromeLiveInteractions:
         print(f"   → Navigating to {new_post_url}...")
         # mcp_chrome-devtools_navigate_page(url=new_post_url)
         
-        time.sleep(1)
-        
         # Take snapshot
         print("   → Verifying create post form...")
         # snapshot = mcp_chrome-devtools_take_snapshot()
@@ -365,8 +344,6 @@ class TestBloggyChromeLiveInteractions:
         print(f"   → Loading {self.BASE_URL}...")
         # mcp_chrome-devtools_navigate_page(url=self.BASE_URL)
         
-        time.sleep(1)
-        
         # Take snapshot to get element UIDs
         print("   → Getting interactive elements...")
         # snapshot = mcp_chrome-devtools_take_snapshot()
@@ -375,8 +352,6 @@ class TestBloggyChromeLiveInteractions:
         print("   → Hovering over post card...")
         # mcp_chrome-devtools_hover(uid='post_card_uid')
         
-        time.sleep(0.5)
-        
         # Take screenshot with hover state
         print("   → Capturing hover state...")
         # mcp_chrome-devtools_take_screenshot(
@@ -65,6 +65,17 @@ class TestPrivateData(BaseModel):
     auto_routes = False  # Explicitly disabled
 
 
+class TestDisabledConfig(BaseModel):
+    """Test model whose auto_routes dict switches routes off."""
+    tablename = 'test_disabled_config'
+    name = Field.string()
+    
+    auto_routes = {
+        'enabled': False,
+        'rest_api': True
+    }
+
+
 class TestValidated(BaseModel):
     """Test model with validation rules."""
     tablename = 'test_validated'
@@ -109,6 +120,7 @@ def register_test_models(app, db):
         TestCategory,
         TestArticle,
         TestPrivateData,
+        TestDisabledConfig,
         TestValidated,
         TestWithDefaults,
         LegacyModel
@@ -161,6 +173,16 @@ def register_test_models(app, db):
             )
         ''')
         
+        # Create test_disabled_config table
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS test_disabled_config (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                created_at TIMESTAMP,
+                updated_at TIMESTAMP,
+                name CHAR(512)
+            )
+        ''')
+        
         # Create test_validated table
         cursor.execute('''
             CREATE TABLE IF NOT EXISTS test_validated (
@@ -244,6 +266,27 @@ def test_category(db, register_test_models):
             pass
 
 
+@pytest.fixture
+def many_products(db, register_test_models):
+    """Create more products than fit on one default list page."""
+    with db.connection():
+        products = [
+            TestProduct.create(name=f'Bulk Widget {i}', price=1.0 + i)
+            for i in range(60)
+        ]
+        db.commit()
+        
+        yield products
+        
+        # Cleanup
+        for product in products:
+            try:
+                product.delete_record()
+            except:
+                pass
+        db.commit()
+
+
 # ========================================================================
 # 1. BASIC ROUTE GENERATION TESTS (6 tests)
 # ========================================================================
@@ -367,7 +410,7 @@ def test_auto_routes_generates_delete_routes(test_client, db, register_test_mode
 
 
 # ========================================================================
-# 2. REST API GENERATION TESTS (5 tests)
+# 2. REST API GENERATION TESTS (10 tests)
 # ========================================================================
 
 def test_auto_routes_generates_rest_list_endpoint(test_client, test_product):
@@ -479,6 +522,102 @@ def test_auto_routes_generates_rest_delete_endpoint(test_client, db, register_te
         deleted_product = TestProduct.get(product_id)
         assert deleted_product is None
 
+def test_rest_list_defaults_to_50_per_page(test_client, many_products):
+    """
+    Test that the REST list endpoint returns one page of 50 records by default.
+    
+    ✅ NO MOCKING - Uses real HTTP request against more than 50 real rows.
+    """
+    response = test_client.get('/api/test_products')
+    
+    assert response.status == 200
+    data = json.loads(response.data)
+    assert data['page'] == 1
+    assert data['per_page'] == 50
+    assert len(data['data']) == 50
+
+
+def test_rest_list_page_offsets(test_client, many_products):
+    """
+    Test that consecutive pages of the REST list endpoint do not overlap.
+    
+    ✅ NO MOCKING - Uses real HTTP requests and real database paging.
+    """
+    first = json.loads(test_client.get('/api/test_products?page=1&per_page=20').data)
+    second = json.loads(test_client.get('/api/test_products?page=2&per_page=20').data)
+    
+    assert first['page'] == 1
+    assert second['page'] == 2
+    assert len(first['data']) == 20
+    assert len(second['data']) == 20
+    first_ids = {item['id'] for item in first['data']}
+    second_ids = {item['id'] for item in second['data']}
+    assert not first_ids & second_ids
+
+
+def test_rest_list_per_page_is_capped_at_500(test_client, many_products):
+    """
+    Test that per_page above the maximum is clamped to 500.
+    
+    ✅ NO MOCKING - Uses real HTTP request.
+    """
+    response = test_client.get('/api/test_products?per_page=100000')
+    
+    assert response.status == 200
+    data = json.loads(response.data)
+    assert data['per_page'] == 500
+    assert len(data['data']) <= 500
+
+
+@pytest.mark.parametrize('query', [
+    'page=0&per_page=0',
+    'page=-3&per_page=-10',
+    'page=abc&per_page=xyz',
+])
+def test_rest_list_invalid_paging_falls_back_to_defaults(test_client, many_products, query):
+    """
+    Test that invalid or non-positive page/per_page values use the defaults.
+    
+    ✅ NO MOCKING - Uses real HTTP request.
+    """
+    response = test_client.get(f'/api/test_products?{query}')
+    
+    assert response.status == 200
+    data = json.loads(response.data)
+    assert data['page'] == 1
+    assert data['per_page'] == 50
+    assert len(data['data']) == 50
+
+
+def test_rest_list_fields_projection(test_client, test_product):
+    """
+    Test that ?fields= limits each record to the requested known fields.
+    
+    ✅ NO MOCKING - Uses real HTTP request and real database row.
+    """
+    response = test_client.get('/api/test_products?fields=name,not_a_field,name')
+    
+    assert response.status == 200
+    data = json.loads(response.data)
+    assert data['data']
+    for item in data['data']:
+        assert set(item) == {'name'}
+
+
+def test_rest_list_unknown_fields_return_full_records(test_client, test_product):
+    """
+    Test that a ?fields= list with no known fields returns full records.
+    
+    ✅ NO MOCKING - Uses real HTTP request and real database row.
+    """
+    response = test_client.get('/api/test_products?fields=not_a_field')
+    
+    assert response.status == 200
+    data = json.loads(response.data)
+    assert data['data']
+    for item in data['data']:
+        assert {'id', 'name', 'price'} <= set(item)
+
 
 # ========================================================================
 # 3. CONFIGURATION OPTIONS TESTS (3 tests)
@@ -537,6 +676,24 @@ def test_auto_routes_disabled_model_has_no_routes(test_client, register_test_mod
     assert response.status == 404
 
 
+def test_auto_routes_enabled_false_has_no_routes(test_client, register_test_models):
+    """
+    Test that auto_routes = {'enabled': False, ...} registers no routes.
+    
+    ✅ NO MOCKING - Verifies routes don't exist.
+    """
+    from auto_routes import parse_auto_routes_config
+    
+    assert parse_auto_routes_config(TestDisabledConfig).enabled is False
+    assert parse_auto_routes_config(TestProduct).enabled is True
+    
+    response = test_client.get('/test_disabled_config/')
+    assert response.status == 404
+    
+    response = test_client.get('/api/test_disabled_config')
+    assert response.status == 404
+
+
 # ========================================================================
 # 4. PERMISSION INTEGRATION TESTS (2 tests)
 # ========================================================================
@@ -735,7 +892,7 @@ def test_complete_crud_workflow(test_client, db, register_test_models):
 
 
 # ========================================================================
-# 9. MODEL DISCOVERY TEST (1 test)
+# 9. MODEL DISCOVERY TESTS (2 tests)
 # ========================================================================
 
 def test_model_discovery_finds_all_auto_routes_models(db):
@@ -764,5 +921,27 @@ def test_model_discovery_finds_all_auto_routes_models(db):
     assert 'LegacyModel' not in discovered_names
 
 
+def test_model_discovery_skips_inherited_auto_routes(db):
+    """
+    Test that a subclass of an auto_routes model is not discovered itself.
+    
+    Only direct BaseModel subclasses are registered, matching the original
+    BaseModel.__subclasses__() scan.
+    
+    ✅ NO MOCKING - Tests real class registration and discovery.
+    """
+    from auto_routes import discover_auto_routes_models
+    
+    class TestProductVariant(TestProduct):
+        pass
+    
+    assert TestProductVariant.auto_routes == TestProduct.auto_routes
+    assert TestProductVariant not in BaseModel._auto_routes_registry
+    
+    discovered = discover_auto_routes_models(db)
+    assert TestProduct in discovered
+    assert TestProductVariant not in discovered
+
+
 if __name__ == '__main__':
     pytest.main([__file__, '-v'])
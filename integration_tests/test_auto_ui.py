@@ -66,6 +66,53 @@ class TestComment(Model):
     created_at = Field.datetime()
 
 
+class TestUIItem(Model):
+    tablename = 'test_ui_items'
+    name = Field.string()
+    rank = Field.int()
+
+
+@pytest.fixture(scope='module')
+def ui_items(app, db):
+    """
+    Serve TestUIItem through auto UI on the real app, with 12 real rows.
+    
+    Pages hold 5 rows sorted by rank, so page 2 is 'Item 06'..'Item 10'.
+    """
+    db.define_models(TestUIItem)
+    
+    with db.connection():
+        db._adapter.cursor.execute('''
+            CREATE TABLE IF NOT EXISTS test_ui_items (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                name CHAR(512),
+                rank INTEGER
+            )
+        ''')
+        items = [
+            TestUIItem.create(name=f'Item {rank:02d}', rank=rank)
+            for rank in range(1, 13)
+        ]
+        db.commit()
+    
+    auto_ui(app, TestUIItem, '/test_ui_items', {
+        'page_size': 5,
+        'sort_default': 'rank',
+        'list_columns': ['id', 'name', 'rank']
+    })
+    
+    yield items
+    
+    # Cleanup
+    with db.connection():
+        for item in items:
+            try:
+                item.delete_record()
+            except:
+                pass
+        db.commit()
+
+
 class TestUIMappingLoader:
     """Test UI mapping loader functionality."""
     
@@ -277,6 +324,32 @@ class TestAutoUIGenerator:
         # Test unconfigured permission (default allow)
         assert generator._check_permission('update') is True
     
+    def test_merge_config_does_not_leak_between_generators(self):
+        """Test that one generator's config doesn't reach another of the same model."""
+        model_config_before = {
+            key: dict(value) if isinstance(value, dict) else value
+            for key, value in TestPost.auto_ui_config.items()
+        }
+        config = {
+            'display_name': 'Locked Post',
+            'permissions': {'list': lambda: False},
+            'field_config': {'title': {'display_name': 'Headline'}}
+        }
+        first = AutoUIGenerator(self.app, TestPost, '/admin/locked-posts', config)
+        second = AutoUIGenerator(self.app, TestPost, '/admin/posts')
+        
+        assert first._check_permission('list') is False
+        assert first.config['field_config'] == {'title': {'display_name': 'Headline'}}
+        
+        # The second generator sees only the defaults and the model config
+        assert second._check_permission('list') is True
+        assert second.config['display_name'] == 'Test Post'
+        assert second.config['field_config'] == {}
+        
+        # Neither the caller's dicts nor the model's config were mutated
+        assert set(config['permissions']) == {'list'}
+        assert TestPost.auto_ui_config == model_config_before
+    
     def test_route_registration(self):
         """Test that routes are registered with the app."""
         generator = AutoUIGenerator(self.app, TestPost, '/admin/posts')
@@ -309,6 +382,83 @@ class TestAutoUIFunction:
         assert generator.url_prefix == '/admin/posts'
 
 
+class TestAutoUIRoutes:
+    """Test generated auto UI routes over real HTTP requests."""
+    
+    def test_list_second_page_rows(self, test_client, ui_items):
+        """
+        Test that page 2 renders the second window of rows.
+        
+        ✅ NO MOCKING - Uses real HTTP request against real database rows.
+        """
+        response = test_client.get('/test_ui_items/?page=2')
+        
+        assert response.status == 200
+        html = response.data
+        for rank in range(6, 11):
+            assert f'Item {rank:02d}' in html
+        assert 'Item 05' not in html
+        assert 'Item 11' not in html
+    
+    @pytest.mark.parametrize('sort', ['-not_a_field', '__class__', 'db'])
+    def test_list_sort_on_non_field_is_ignored(self, test_client, ui_items, sort):
+        """
+        Test that sorting by a name that isn't a table field falls back to id.
+        
+        ✅ NO MOCKING - Uses real HTTP request against real database rows.
+        """
+        response = test_client.get(f'/test_ui_items/?sort={sort}')
+        
+        assert response.status == 200
+        html = response.data
+        for rank in range(1, 6):
+            assert f'Item {rank:02d}' in html
+        assert 'Item 12' not in html
+    
+    def test_list_sort_on_field_descending(self, test_client, ui_items):
+        """
+        Test that a '-' prefixed table field sorts descending.
+        
+        ✅ NO MOCKING - Uses real HTTP request against real database rows.
+        """
+        response = test_client.get('/test_ui_items/?sort=-rank')
+        
+        assert response.status == 200
+        html = response.data
+        assert 'Item 12' in html
+        assert 'Item 01' not in html
+    
+    def test_delete_missing_record_returns_404(self, test_client, db, ui_items):
+        """
+        Test that deleting an id that doesn't exist returns 404.
+        
+        ✅ NO MOCKING - Uses real HTTP POST and verifies real rows are untouched.
+        """
+        missing_id = max(item.id for item in ui_items) + 1000
+        
+        response = test_client.post(f'/test_ui_items/{missing_id}/delete')
+        
+        assert response.status == 404
+        with db.connection():
+            assert db(TestUIItem.id.belongs([item.id for item in ui_items])).count() == len(ui_items)
+    
+    def test_delete_existing_record(self, test_client, db, ui_items):
+        """
+        Test that deleting an existing id removes it and redirects to the list.
+        
+        ✅ NO MOCKING - Uses real HTTP POST and verifies real database deletion.
+        """
+        with db.connection():
+            item = TestUIItem.create(name='Item to delete', rank=99)
+            db.commit()
+        
+        response = test_client.post(f'/test_ui_items/{item.id}/delete')
+        
+        assert response.status in [200, 302, 303]
+        with db.connection():
+            assert TestUIItem.get(item.id) is None
+
+
 if __name__ == '__main__':
     pytest.main([__file__, '-v'])
 
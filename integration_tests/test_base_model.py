@@ -0,0 +1,252 @@
+# -*- coding: utf-8 -*-
+"""
+Tests for BaseModel
+
+🚨 CRITICAL POLICY: NO MOCKING ALLOWED 🚨
+
+⚠️ USING MOCKS, STUBS, OR TEST DOUBLES IS ILLEGAL IN THIS REPOSITORY ⚠️
+
+This is a ZERO-TOLERANCE POLICY:
+- ❌ FORBIDDEN: unittest.mock, Mock(), MagicMock(), patch()
+- ❌ FORBIDDEN: pytest-mock, mocker fixture
+- ❌ FORBIDDEN: Any mocking, stubbing, or test double libraries
+- ❌ FORBIDDEN: Fake in-memory databases or fake HTTP responses
+- ❌ FORBIDDEN: Simulated external services or APIs
+
+✅ ONLY REAL INTEGRATION TESTS ARE ALLOWED:
+- ✅ Real database operations with actual SQL
+- ✅ Real HTTP requests through test client
+- ✅ Real browser interactions with Chrome DevTools MCP
+- ✅ Real external service calls (or skip tests if unavailable)
+
+If you write a test with mocks, the test is INVALID and must be rewritten.
+
+Tests the BaseModel functionality including:
+- Override decorators (registration, inheritance, replacement)
+- Background email queue (queued, full-queue and exit flush paths)
+- Default XML formatting
+"""
+
+import logging
+import queue
+import time
+
+import pytest
+from emmett.orm import Field
+
+import app as app_module
+import base_model
+from base_model import BaseModel, http_handler, response_formatter, email_handler
+
+
+# ========================================================================
+# TEST MODELS - Defined at module level for proper ORM registration
+# ========================================================================
+
+class OverrideWidget(BaseModel):
+    """Model overriding one handler, formatter and email handler."""
+    tablename = 'test_override_widgets'
+    name = Field.string()
+    
+    @http_handler('read')
+    def custom_read(self, req):
+        return {'handler': 'widget', 'req': req}
+    
+    @response_formatter('json')
+    def custom_json(self, data):
+        return {'formatter': 'widget', 'data': data}
+    
+    @email_handler('welcome')
+    def custom_welcome(self, to, subject, body):
+        return {'email': 'widget', 'to': to}
+
+
+class InheritedOverrideWidget(OverrideWidget):
+    """Subclass that keeps its parent's overrides."""
+    tablename = 'test_inherited_override_widgets'
+
+
+class ReplacedOverrideWidget(OverrideWidget):
+    """Subclass replacing the parent's json formatter with its own."""
+    tablename = 'test_replaced_override_widgets'
+    
+    @response_formatter('json')
+    def replacement_json(self, data):
+        return {'formatter': 'replaced', 'data': data}
+
+
+class XmlWidget(BaseModel):
+    """Model whose to_dict hides a field and adds a computed key."""
+    tablename = 'test_xml_widgets'
+    name = Field.string()
+    password = Field.string()
+    
+    def to_dict(self):
+        return {'name': 'Widget', 'display': 'Widget (public)'}
+
+
+# ========================================================================
+# FIXTURES
+# ========================================================================
+
+@pytest.fixture(scope='module')
+def widgets(db):
+    """Define the test models on the real database and instantiate them."""
+    db.define_models(OverrideWidget, InheritedOverrideWidget, ReplacedOverrideWidget)
+    return OverrideWidget(), InheritedOverrideWidget(), ReplacedOverrideWidget()
+
+
+# ========================================================================
+# 1. OVERRIDE DECORATOR TESTS
+# ========================================================================
+
+def test_override_decorators_are_dispatched(widgets):
+    """
+    Test that decorated overrides replace the defaults they target.
+    
+    ✅ NO MOCKING - Dispatches through the real model registries.
+    """
+    widget = widgets[0]
+    
+    assert widget.handle_request('read', req='request') == {'handler': 'widget', 'req': 'request'}
+    assert widget.format_response({'a': 1}) == {'formatter': 'widget', 'data': {'a': 1}}
+    assert widget.send_email('a@example.com', 'Hi', 'Body', email_type='welcome') == {
+        'email': 'widget', 'to': 'a@example.com'
+    }
+    
+    # Operations and formats without an override keep the defaults
+    assert OverrideWidget._http_handlers['delete'] is OverrideWidget._default_delete_handler
+    assert OverrideWidget._response_formatters['xml'] is OverrideWidget._default_xml_formatter
+
+
+def test_override_decorators_are_inherited(widgets):
+    """
+    Test that a subclass dispatches to its parent's overrides.
+    
+    ✅ NO MOCKING - Dispatches through the real model registries.
+    """
+    widget = widgets[1]
+    
+    assert widget.handle_request('read', req='request') == {'handler': 'widget', 'req': 'request'}
+    assert widget.format_response({'a': 1}) == {'formatter': 'widget', 'data': {'a': 1}}
+    assert widget.send_email('a@example.com', 'Hi', 'Body', email_type='welcome') == {
+        'email': 'widget', 'to': 'a@example.com'
+    }
+
+
+def test_override_decorators_can_be_replaced_in_subclass(widgets):
+    """
+    Test that a subclass override replaces the inherited one for that
+    subclass only.
+    
+    ✅ NO MOCKING - Dispatches through the real model registries.
+    """
+    parent, _, replaced = widgets
+    
+    assert replaced.format_response({'a': 1}) == {'formatter': 'replaced', 'data': {'a': 1}}
+    # The other inherited overrides still apply
+    assert replaced.handle_request('read', req='request') == {'handler': 'widget', 'req': 'request'}
+    # The parent is unaffected
+    assert parent.format_response({'a': 1}) == {'formatter': 'widget', 'data': {'a': 1}}
+    # Registries are per class
+    assert ReplacedOverrideWidget._response_formatters is not OverrideWidget._response_formatters
+
+
+
+# ========================================================================
+# 2. EMAIL QUEUE TESTS
+# ========================================================================
+
+def _message(n):
+    return {'to': f'user{n}@example.com', 'subject': f'Test {n}', 'body': 'Body'}
+
+
+def test_email_is_queued_and_flushed():
+    """
+    Test that mail goes to the background worker and is reported as queued,
+    not sent, and that the exit flush waits for the worker to drain it.
+    
+    ✅ NO MOCKING - Uses the real worker thread, queue and app Mailer.
+    """
+    base_model._start_email_worker()
+    
+    results = [
+        base_model._queue_email(base_model._email_queue, app_module.mailer, _message(n))
+        for n in range(3)
+    ]
+    
+    assert results == [{'queued': True, 'message': 'Email queued'}] * 3
+    
+    base_model._flush_emails()
+    assert base_model._email_queue.unfinished_tasks == 0
+
+
+def test_email_sent_synchronously_when_queue_full():
+    """
+    Test that a full queue makes the message go out synchronously instead
+    of being dropped or queued.
+    
+    ✅ NO MOCKING - Uses a real bounded queue and the app Mailer.
+    """
+    full_queue = queue.Queue(maxsize=1)
+    full_queue.put((app_module.mailer, _message(0)))
+    
+    result = base_model._queue_email(full_queue, app_module.mailer, _message(1))
+    
+    assert 'queued' not in result
+    if result['success']:
+        assert result == {'success': True, 'message': 'Email sent'}
+    else:
+        assert result['error']
+    # Nothing was added to the full queue
+    assert full_queue.qsize() == 1
+
+
+def test_email_flush_gives_up_after_timeout(caplog):
+    """
+    Test that the exit flush stops waiting after its timeout and logs the
+    undelivered count.
+    
+    ✅ NO MOCKING - Uses a real queue with no worker serving it.
+    """
+    stalled_queue = queue.Queue()
+    stalled_queue.put((app_module.mailer, _message(0)))
+    
+    start = time.monotonic()
+    with caplog.at_level(logging.WARNING, logger='base_model'):
+        base_model._flush_emails(stalled_queue, timeout=0.2)
+    elapsed = time.monotonic() - start
+    
+    assert 0.2 <= elapsed < 5
+    assert stalled_queue.unfinished_tasks == 1
+    assert 'Exiting with 1 queued emails undelivered' in caplog.text
+
+
+
+# ========================================================================
+# 3. XML FORMATTER TESTS
+# ========================================================================
+
+def test_xml_formatter_follows_to_dict(db):
+    """
+    Test that the default XML formatter emits exactly the keys to_dict()
+    returns, even when they differ from the table fields.
+    
+    ✅ NO MOCKING - Uses a real model defined on the real database.
+    """
+    db.define_models(XmlWidget)
+    
+    xml = XmlWidget().format_response({}, 'xml')
+    
+    assert xml == (
+        '<?xml version="1.0"?>\n'
+        '<xmlwidget>\n'
+        '  <name>Widget</name>\n'
+        '  <display>Widget (public)</display>\n'
+        '</xmlwidget>'
+    )
+    assert 'password' not in xml
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
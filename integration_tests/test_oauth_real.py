@@ -58,7 +58,9 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'runtime'))
 from emmett.orm import Field
 from emmett.orm.migrations.utils import generate_runtime_migration
 from app import app, db, User, OAuthAccount, OAuthToken
-from auth.tokens import encrypt_token, decrypt_token, generate_encryption_key
+from auth.tokens import (
+    encrypt_token, decrypt_token, encrypt_tokens, decrypt_tokens, generate_encryption_key
+)
 from auth.providers.base import BaseOAuthProvider
 from auth.providers.google import GoogleOAuthProvider
 from auth.oauth_manager import OAuthManager
@@ -187,7 +189,7 @@ class TestRealTokenEncryption:
         
         # Reset cipher for new key
         import auth.tokens
-        auth.tokens._cipher = None
+        auth.tokens._get_cipher.cache_clear()
         
         test_tokens = [
             "short",
@@ -202,6 +204,110 @@ class TestRealTokenEncryption:
             decrypted = decrypt_token(encrypted)
             assert decrypted == token, f"Roundtrip failed for: {token}"
     
+    def test_legacy_fernet_token_decrypts_real(self):
+        """Test tokens stored with Fernet before AES-GCM still decrypt"""
+        key = Fernet.generate_key()
+        os.environ['OAUTH_TOKEN_ENCRYPTION_KEY'] = key.decode()
+        
+        import auth.tokens
+        auth.tokens._get_cipher.cache_clear()
+        
+        # Encrypt the way earlier versions stored tokens
+        legacy = Fernet(key).encrypt(b"legacy_access_token").decode()
+        
+        assert decrypt_token(legacy) == "legacy_access_token"
+        assert decrypt_token(legacy.encode()) == "legacy_access_token"
+    
+    def test_aesgcm_key_differs_from_fernet_key_real(self):
+        """Test new tokens are not encrypted with the raw Fernet key"""
+        key = Fernet.generate_key()
+        os.environ['OAUTH_TOKEN_ENCRYPTION_KEY'] = key.decode()
+        
+        import auth.tokens
+        auth.tokens._get_cipher.cache_clear()
+        
+        encrypted = encrypt_token("secret")
+        data = base64.urlsafe_b64decode(encrypted)
+        
+        # Decrypting with the raw key as AES-GCM key must fail
+        from cryptography.exceptions import InvalidTag
+        from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+        raw_cipher = AESGCM(base64.urlsafe_b64decode(key))
+        with pytest.raises(InvalidTag):
+            raw_cipher.decrypt(data[1:13], data[13:], None)
+        
+        assert decrypt_token(encrypted) == "secret"
+    
+    def test_bytes_roundtrip_real(self):
+        """Test bytes input and return_bytes output"""
+        os.environ['OAUTH_TOKEN_ENCRYPTION_KEY'] = Fernet.generate_key().decode()
+        
+        import auth.tokens
+        auth.tokens._get_cipher.cache_clear()
+        
+        encrypted = encrypt_token(b"bytes_token", return_bytes=True)
+        assert isinstance(encrypted, bytes)
+        
+        decrypted = decrypt_token(encrypted, return_bytes=True)
+        assert decrypted == b"bytes_token"
+        assert decrypt_token(encrypted.decode()) == "bytes_token"
+    
+    def test_batch_roundtrip_real(self):
+        """Test encrypt_tokens / decrypt_tokens roundtrip"""
+        os.environ['OAUTH_TOKEN_ENCRYPTION_KEY'] = Fernet.generate_key().decode()
+        
+        import auth.tokens
+        auth.tokens._get_cipher.cache_clear()
+        
+        tokens = ["first", "second_" + "y" * 200, "third!@#"]
+        encrypted = encrypt_tokens(tokens)
+        
+        assert len(encrypted) == len(tokens)
+        assert len(set(encrypted)) == len(tokens)
+        assert decrypt_tokens(encrypted) == tokens
+        
+        # Batch and single-token APIs are interchangeable
+        assert [decrypt_token(e) for e in encrypted] == tokens
+        assert decrypt_tokens([encrypt_token(t) for t in tokens]) == tokens
+    
+    def test_batch_mixed_legacy_and_bytes_real(self):
+        """Test decrypt_tokens with legacy Fernet, new, and bytes tokens mixed"""
+        key = Fernet.generate_key()
+        os.environ['OAUTH_TOKEN_ENCRYPTION_KEY'] = key.decode()
+        
+        import auth.tokens
+        auth.tokens._get_cipher.cache_clear()
+        
+        legacy = Fernet(key).encrypt(b"legacy").decode()
+        new = encrypt_token("new")
+        new_bytes = encrypt_token("new_bytes", return_bytes=True)
+        legacy_bytes = Fernet(key).encrypt(b"legacy_bytes")
+        
+        assert decrypt_tokens([legacy, new, new_bytes, legacy_bytes]) == [
+            "legacy", "new", "new_bytes", "legacy_bytes"
+        ]
+        assert decrypt_tokens(encrypt_tokens([b"raw", "text"])) == ["raw", "text"]
+    
+    def test_batch_empty_token_rejected_real(self):
+        """Test batch APIs reject empty tokens like the single-token ones"""
+        with pytest.raises(ValueError):
+            encrypt_tokens(["ok", ""])
+        with pytest.raises(ValueError):
+            decrypt_tokens([""])
+    
+    @pytest.mark.parametrize('truncated', ['AQ==', 'AQID', b'AQ=='])
+    def test_truncated_token_raises_invalid_token_real(self, truncated):
+        """Test that a token holding little more than the version byte is InvalidToken"""
+        os.environ['OAUTH_TOKEN_ENCRYPTION_KEY'] = generate_encryption_key()
+        
+        import auth.tokens
+        auth.tokens._get_cipher.cache_clear()
+        
+        with pytest.raises(InvalidToken):
+            decrypt_token(truncated)
+        with pytest.raises(InvalidToken):
+            decrypt_tokens([truncated])
+    
     def test_wrong_key_fails_real(self):
         """Test that wrong encryption key fails (real Fernet validation)"""
         # Encrypt with one key
@@ -209,7 +315,7 @@ class TestRealTokenEncryption:
         os.environ['OAUTH_TOKEN_ENCRYPTION_KEY'] = key1
         
         import auth.tokens
-        auth.tokens._cipher = None
+        auth.tokens._get_cipher.cache_clear()
         
         token = "secret"
         encrypted = encrypt_token(token)
@@ -217,7 +323,7 @@ class TestRealTokenEncryption:
         # Try to decrypt with different key
         key2 = Fernet.generate_key().decode()
         os.environ['OAUTH_TOKEN_ENCRYPTION_KEY'] = key2
-        auth.tokens._cipher = None
+        auth.tokens._get_cipher.cache_clear()
         
         # Real Fernet will raise InvalidToken
         with pytest.raises(InvalidToken):
@@ -479,7 +585,7 @@ class TestRealOAuthSecurity:
         os.environ['OAUTH_TOKEN_ENCRYPTION_KEY'] = Fernet.generate_key().decode()
         
         import auth.tokens
-        auth.tokens._cipher = None
+        auth.tokens._get_cipher.cache_clear()
         
         # Encrypt sensitive token
         sensitive_token = "very_secret_access_token_12345"
@@ -408,7 +408,7 @@ class TestRealUserOAuth:
             # Verify token is really encrypted
             stored = db.oauth_tokens[token_id]
             assert stored.access_token_encrypted != real_oauth_token['access_token']
-            assert 'gAAAAA' in stored.access_token_encrypted  # Fernet signature
+            assert stored.access_token_encrypted.startswith('AQ')  # AES-GCM version byte
             
             # Verify we can decrypt to get original token
             decrypted = decrypt_token(stored.access_token_encrypted)
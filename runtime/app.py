@@ -704,13 +704,13 @@ async def oauth_login(provider):
 
     try:
         # Exchange code for tokens
-        token_data = provider_instance.exchange_code_for_tokens(code, code_verifier)
+        token_data = await provider_instance.aexchange_code_for_tokens(code, code_verifier)
         access_token = token_data.get('access_token')
         refresh_token = token_data.get('refresh_token')
         expires_in = token_data.get('expires_in')
 
         # Get user info from provider
-        user_info = provider_instance.get_user_info(access_token)
+        user_info = await provider_instance.aget_user_info(access_token)
         provider_user_id = str(user_info.get('id'))
         email = user_info.get('email')
         email_verified = user_info.get('email_verified', False)
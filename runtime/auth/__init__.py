@@ -3,7 +3,13 @@
 OAuth authentication module for social login support.
 """
 
-from .tokens import encrypt_token, decrypt_token, generate_encryption_key
+from .tokens import (
+    encrypt_token,
+    decrypt_token,
+    encrypt_tokens,
+    decrypt_tokens,
+    generate_encryption_key
+)
 from .oauth_manager import OAuthManager, get_oauth_manager
 from .linking import (
     find_existing_user_by_email,
@@ -15,6 +21,8 @@ from .linking import (
 __all__ = [
     'encrypt_token',
     'decrypt_token',
+    'encrypt_tokens',
+    'decrypt_tokens',
     'generate_encryption_key',
     'OAuthManager',
     'get_oauth_manager',
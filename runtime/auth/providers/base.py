@@ -3,14 +3,30 @@
 Base OAuth provider class with PKCE support.
 """
 
+import asyncio
 import hashlib
 import secrets
 import base64
 from abc import ABC, abstractmethod
-from typing import Dict, Tuple, List
+from typing import Any, Dict, Tuple, List
 import requests
 from urllib.parse import urlencode
 
+try:
+    # orjson decodes bytes directly and is considerably faster than stdlib json
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
+
+try:
+    # Optional: enables non-blocking provider calls from async routes
+    import httpx
+except ImportError:
+    httpx = None  # type: ignore[assignment]
+
+# Per-request headers for token endpoint calls (session defaults supply the rest)
+_FORM_HEADERS = {'Content-Type': 'application/x-www-form-urlencoded'}
+
 
 class BaseOAuthProvider(ABC):
     """
@@ -24,6 +40,8 @@ class BaseOAuthProvider(ABC):
     token_url: str = None  # type: ignore[assignment]
     userinfo_url: str = None  # type: ignore[assignment]
     scopes: List[str] = []
+    # Headers sent with every request made through the provider's session
+    default_headers: Dict[str, str] = {'Accept': 'application/json'}
     
     def __init__(self, client_id: str, client_secret: str, redirect_uri: str):
         """
@@ -44,6 +62,14 @@ class BaseOAuthProvider(ABC):
         self.client_id = client_id
         self.client_secret = client_secret
         self.redirect_uri = redirect_uri
+        
+        # Constant headers are set once on the session; calls only pass what varies
+        self._session = requests.Session()
+        self._session.headers.update(self.default_headers)
+        # Created lazily on first async call (requires httpx)
+        self._aclient = None
+        # Provider-specific authorization params, computed on first use
+        self._extra_params = None
     
     @staticmethod
     def generate_state() -> str:
@@ -53,7 +79,7 @@ class BaseOAuthProvider(ABC):
         Returns:
             str: Random state string (32 bytes, URL-safe base64)
         """
-        return base64.urlsafe_b64encode(secrets.token_bytes(32)).decode('utf-8').rstrip('=')
+        return base64.urlsafe_b64encode(secrets.token_bytes(32)).rstrip(b'=').decode('ascii')
     
     @staticmethod
     def generate_pkce_pair() -> Tuple[str, str]:
@@ -66,12 +92,12 @@ class BaseOAuthProvider(ABC):
         # Generate code_verifier (43-128 characters, URL-safe)
         code_verifier = base64.urlsafe_b64encode(
             secrets.token_bytes(32)
-        ).decode('utf-8').rstrip('=')
+        ).rstrip(b'=').decode('ascii')
         
         # Generate code_challenge (SHA256 hash of verifier)
         code_challenge = base64.urlsafe_b64encode(
             hashlib.sha256(code_verifier.encode('utf-8')).digest()
-        ).decode('utf-8').rstrip('=')
+        ).rstrip(b'=').decode('ascii')
         
         return code_verifier, code_challenge
     
@@ -97,19 +123,109 @@ class BaseOAuthProvider(ABC):
         }
         
         # Allow subclasses to add provider-specific parameters
-        params.update(self.get_additional_auth_params())
+        if self._extra_params is None:
+            self._extra_params = self.get_additional_auth_params()
+        params.update(self._extra_params)
         
         return f"{self.authorize_url}?{urlencode(params)}"
     
+    @staticmethod
+    def decode_json(response: Any) -> Any:
+        """
+        Decode a JSON response body.
+        
+        Args:
+            response: HTTP response from the provider (requests or httpx)
+            
+        Returns:
+            Decoded JSON payload
+        """
+        return _json_loads(response.content)
+    
+    def get_json(self, url: str, access_token: str) -> Any:
+        """
+        GET a JSON resource with a Bearer token.
+        
+        Args:
+            url: Resource URL
+            access_token: Valid access token
+            
+        Returns:
+            Decoded JSON payload
+            
+        Raises:
+            requests.HTTPError: If API call fails
+        """
+        response = self._session.get(
+            url,
+            headers={'Authorization': f'Bearer {access_token}'},
+            timeout=10
+        )
+        response.raise_for_status()
+        return self.decode_json(response)
+    
+    async def aget_json(self, url: str, access_token: str) -> Any:
+        """
+        Async variant of get_json.
+        
+        Args:
+            url: Resource URL
+            access_token: Valid access token
+            
+        Returns:
+            Decoded JSON payload
+        """
+        client = self._get_async_client()
+        if client is None:
+            return await asyncio.to_thread(self.get_json, url, access_token)
+        
+        response = await client.get(
+            url,
+            headers={'Authorization': f'Bearer {access_token}'}
+        )
+        response.raise_for_status()
+        return self.decode_json(response)
+    
     def get_additional_auth_params(self) -> Dict[str, str]:
         """
         Override to add provider-specific authorization parameters.
+        Called once per provider instance; the result is reused.
         
         Returns:
             Dict[str, str]: Additional parameters for authorization URL
         """
         return {}
     
+    def _authorization_code_data(self, code: str, code_verifier: str) -> Dict[str, str]:
+        """Form body for the authorization code grant."""
+        return {
+            'client_id': self.client_id,
+            'client_secret': self.client_secret,
+            'code': code,
+            'code_verifier': code_verifier,
+            'grant_type': 'authorization_code',
+            'redirect_uri': self.redirect_uri
+        }
+    
+    def _refresh_token_data(self, refresh_token: str) -> Dict[str, str]:
+        """Form body for the refresh token grant."""
+        return {
+            'client_id': self.client_id,
+            'client_secret': self.client_secret,
+            'refresh_token': refresh_token,
+            'grant_type': 'refresh_token'
+        }
+    
+    def _parse_token_response(self, response: Any) -> Dict[str, object]:
+        """Validate and decode a token endpoint response."""
+        response.raise_for_status()
+        token_data = self.decode_json(response)
+        
+        if 'access_token' not in token_data:
+            raise ValueError(f"No access_token in response from {self.provider_name}")
+        
+        return token_data
+    
     def exchange_code_for_tokens(
         self, 
         code: str, 
@@ -134,34 +250,14 @@ class BaseOAuthProvider(ABC):
             requests.HTTPError: If token exchange fails
             ValueError: If response is invalid
         """
-        data = {
-            'client_id': self.client_id,
-            'client_secret': self.client_secret,
-            'code': code,
-            'code_verifier': code_verifier,
-            'grant_type': 'authorization_code',
-            'redirect_uri': self.redirect_uri
-        }
-        
-        headers = {
-            'Accept': 'application/json',
-            'Content-Type': 'application/x-www-form-urlencoded'
-        }
-        
-        response = requests.post(
+        response = self._session.post(
             self.token_url,
-            data=data,
-            headers=headers,
+            data=self._authorization_code_data(code, code_verifier),
+            headers=_FORM_HEADERS,
             timeout=10
         )
         
-        response.raise_for_status()
-        token_data = response.json()
-        
-        if 'access_token' not in token_data:
-            raise ValueError(f"No access_token in response from {self.provider_name}")
-        
-        return token_data
+        return self._parse_token_response(response)
     
     def refresh_access_token(self, refresh_token: str) -> Dict[str, object]:
         """
@@ -176,27 +272,92 @@ class BaseOAuthProvider(ABC):
         Raises:
             requests.HTTPError: If refresh fails
         """
-        data = {
-            'client_id': self.client_id,
-            'client_secret': self.client_secret,
-            'refresh_token': refresh_token,
-            'grant_type': 'refresh_token'
-        }
+        response = self._session.post(
+            self.token_url,
+            data=self._refresh_token_data(refresh_token),
+            headers=_FORM_HEADERS,
+            timeout=10
+        )
         
-        headers = {
-            'Accept': 'application/json',
-            'Content-Type': 'application/x-www-form-urlencoded'
-        }
+        response.raise_for_status()
+        return self.decode_json(response)
+    
+    def _get_async_client(self) -> Any:
+        """
+        Get the shared async HTTP client for this provider.
+        
+        Returns:
+            httpx.AsyncClient, or None if httpx is not installed
+        """
+        if httpx is None:
+            return None
+        
+        if self._aclient is None:
+            limits = httpx.Limits(max_connections=20)
+            try:
+                self._aclient = httpx.AsyncClient(
+                    http2=True,
+                    headers=self.default_headers,
+                    limits=limits,
+                    timeout=10
+                )
+            except ImportError:
+                # HTTP/2 support needs the optional h2 package
+                self._aclient = httpx.AsyncClient(
+                    headers=self.default_headers,
+                    limits=limits,
+                    timeout=10
+                )
+        
+        return self._aclient
+    
+    async def aexchange_code_for_tokens(
+        self,
+        code: str,
+        code_verifier: str
+    ) -> Dict[str, object]:
+        """
+        Async variant of exchange_code_for_tokens.
         
-        response = requests.post(
+        Falls back to running the sync call in a worker thread when httpx
+        is not installed, so the event loop is never blocked.
+        """
+        client = self._get_async_client()
+        if client is None:
+            return await asyncio.to_thread(self.exchange_code_for_tokens, code, code_verifier)
+        
+        response = await client.post(
             self.token_url,
-            data=data,
-            headers=headers,
-            timeout=10
+            data=self._authorization_code_data(code, code_verifier),
+            headers=_FORM_HEADERS
+        )
+        
+        return self._parse_token_response(response)
+    
+    async def arefresh_access_token(self, refresh_token: str) -> Dict[str, object]:
+        """
+        Async variant of refresh_access_token.
+        """
+        client = self._get_async_client()
+        if client is None:
+            return await asyncio.to_thread(self.refresh_access_token, refresh_token)
+        
+        response = await client.post(
+            self.token_url,
+            data=self._refresh_token_data(refresh_token),
+            headers=_FORM_HEADERS
         )
         
         response.raise_for_status()
-        return response.json()
+        return self.decode_json(response)
+    
+    async def aget_user_info(self, access_token: str) -> Dict[str, object]:
+        """
+        Async variant of get_user_info.
+        Override to use the async client; the default runs the sync
+        implementation in a worker thread.
+        """
+        return await asyncio.to_thread(self.get_user_info, access_token)
     
     @abstractmethod
     def get_user_info(self, access_token: str) -> Dict[str, object]:
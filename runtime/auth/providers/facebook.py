@@ -4,7 +4,6 @@ Facebook OAuth 2.0 provider implementation.
 """
 
 from typing import Dict
-import requests
 from .base import BaseOAuthProvider
 
 
@@ -16,6 +15,7 @@ class FacebookOAuthProvider(BaseOAuthProvider):
     token_url = 'https://graph.facebook.com/v18.0/oauth/access_token'
     userinfo_url = 'https://graph.facebook.com/v18.0/me'
     scopes = ['email', 'public_profile']
+    userinfo_fields = 'id,email,name,first_name,last_name,picture.type(large)'
     
     def get_user_info(self, access_token: str) -> Dict[str, any]:
         """
@@ -29,25 +29,41 @@ class FacebookOAuthProvider(BaseOAuthProvider):
         """
         # Request specific fields from Facebook
         params = {
-            'fields': 'id,email,name,first_name,last_name,picture.type(large)',
+            'fields': self.userinfo_fields,
             'access_token': access_token
         }
         
-        response = requests.get(
+        response = self._session.get(
             self.userinfo_url,
             params=params,
             timeout=10
         )
         
         response.raise_for_status()
-        data = response.json()
+        return self._normalize_user_info(self.decode_json(response))
+    
+    async def aget_user_info(self, access_token: str) -> Dict[str, any]:
+        """Async variant of get_user_info."""
+        client = self._get_async_client()
+        if client is None:
+            return await super().aget_user_info(access_token)
+        
+        response = await client.get(
+            self.userinfo_url,
+            params={'fields': self.userinfo_fields, 'access_token': access_token}
+        )
         
+        response.raise_for_status()
+        return self._normalize_user_info(self.decode_json(response))
+    
+    @staticmethod
+    def _normalize_user_info(data: Dict[str, any]) -> Dict[str, any]:
+        """Normalize Facebook's response to our standard format."""
         # Extract picture URL from nested structure
         picture_url = None
         if 'picture' in data and 'data' in data['picture']:
             picture_url = data['picture']['data'].get('url')
         
-        # Normalize Facebook's response to our standard format
         return {
             'id': data.get('id'),
             'email': data.get('email'),  # May be None if user denied email permission
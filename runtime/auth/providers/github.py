@@ -3,8 +3,7 @@
 GitHub OAuth 2.0 provider implementation.
 """
 
-from typing import Dict
-import requests
+from typing import Dict, List, Optional, Tuple
 from .base import BaseOAuthProvider
 
 
@@ -17,6 +16,10 @@ class GitHubOAuthProvider(BaseOAuthProvider):
     userinfo_url = 'https://api.github.com/user'
     emails_url = 'https://api.github.com/user/emails'
     scopes = ['user:email', 'read:user']
+    default_headers = {
+        'Accept': 'application/json',
+        'User-Agent': 'Emmett-OAuth-App'  # GitHub requires User-Agent
+    }
     
     def get_user_info(self, access_token: str) -> Dict[str, any]:
         """
@@ -28,20 +31,8 @@ class GitHubOAuthProvider(BaseOAuthProvider):
         Returns:
             Dict with normalized user data
         """
-        headers = {
-            'Authorization': f'Bearer {access_token}',
-            'Accept': 'application/json',
-            'User-Agent': 'Emmett-OAuth-App'  # GitHub requires User-Agent
-        }
-        
         # Get user profile
-        response = requests.get(
-            self.userinfo_url,
-            headers=headers,
-            timeout=10
-        )
-        response.raise_for_status()
-        user_data = response.json()
+        user_data = self.get_json(self.userinfo_url, access_token)
         
         # Get email addresses (GitHub may not include email in user profile)
         email = user_data.get('email')
@@ -49,34 +40,68 @@ class GitHubOAuthProvider(BaseOAuthProvider):
         
         if not email:
             # Fetch email from emails endpoint
-            email_response = requests.get(
+            email_response = self._session.get(
                 self.emails_url,
-                headers=headers,
+                headers={'Authorization': f'Bearer {access_token}'},
                 timeout=10
             )
             if email_response.status_code == 200:
-                emails = email_response.json()
-                # Find primary verified email
-                for e in emails:
-                    if e.get('primary') and e.get('verified'):
-                        email = e.get('email')
-                        email_verified = True
-                        break
-                # If no primary verified email, use first verified email
-                if not email:
-                    for e in emails:
-                        if e.get('verified'):
-                            email = e.get('email')
-                            email_verified = True
-                            break
-                # Last resort: use any email
-                if not email and emails:
-                    email = emails[0].get('email')
+                email, email_verified = self._select_email(self.decode_json(email_response))
         else:
             # Email from profile is considered verified by GitHub
             email_verified = True
         
-        # Normalize GitHub's response to our standard format
+        return self._normalize_user_info(user_data, email, email_verified)
+    
+    async def aget_user_info(self, access_token: str) -> Dict[str, any]:
+        """Async variant of get_user_info."""
+        client = self._get_async_client()
+        if client is None:
+            return await super().aget_user_info(access_token)
+        
+        user_data = await self.aget_json(self.userinfo_url, access_token)
+        
+        email = user_data.get('email')
+        email_verified = bool(email)
+        
+        if not email:
+            email_response = await client.get(
+                self.emails_url,
+                headers={'Authorization': f'Bearer {access_token}'}
+            )
+            if email_response.status_code == 200:
+                email, email_verified = self._select_email(self.decode_json(email_response))
+        
+        return self._normalize_user_info(user_data, email, email_verified)
+    
+    @staticmethod
+    def _select_email(emails: List[Dict[str, any]]) -> Tuple[Optional[str], bool]:
+        """
+        Pick the best address from the emails endpoint.
+        
+        Single pass: prefer primary verified, then any verified, then any email.
+        
+        Returns:
+            Tuple of (email, email_verified)
+        """
+        primary = verified = fallback = None
+        for e in emails:
+            em = e.get('email')
+            if not em:
+                continue
+            if e.get('primary') and e.get('verified'):
+                primary = em
+                break
+            if e.get('verified') and not verified:
+                verified = em
+            if not fallback:
+                fallback = em
+        return primary or verified or fallback, bool(primary or verified)
+    
+    @staticmethod
+    def _normalize_user_info(user_data: Dict[str, any], email: Optional[str],
+                             email_verified: bool) -> Dict[str, any]:
+        """Normalize GitHub's response to our standard format."""
         return {
             'id': str(user_data.get('id')),
             'email': email,
@@ -87,4 +112,3 @@ class GitHubOAuthProvider(BaseOAuthProvider):
             'picture': user_data.get('avatar_url'),
             'locale': None  # GitHub doesn't provide locale
         }
-
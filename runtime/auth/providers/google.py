@@ -4,7 +4,6 @@ Google OAuth 2.0 provider implementation.
 """
 
 from typing import Dict
-import requests
 from .base import BaseOAuthProvider
 
 
@@ -35,21 +34,34 @@ class GoogleOAuthProvider(BaseOAuthProvider):
         Returns:
             Dict with normalized user data
         """
-        headers = {
-            'Authorization': f'Bearer {access_token}',
-            'Accept': 'application/json'
-        }
+        headers = {'Authorization': f'Bearer {access_token}'}
         
-        response = requests.get(
+        response = self._session.get(
             self.userinfo_url,
             headers=headers,
             timeout=10
         )
         
         response.raise_for_status()
-        data = response.json()
+        return self._normalize_user_info(self.decode_json(response))
+    
+    async def aget_user_info(self, access_token: str) -> Dict[str, any]:
+        """Async variant of get_user_info."""
+        client = self._get_async_client()
+        if client is None:
+            return await super().aget_user_info(access_token)
         
-        # Normalize Google's response to our standard format
+        response = await client.get(
+            self.userinfo_url,
+            headers={'Authorization': f'Bearer {access_token}'}
+        )
+        
+        response.raise_for_status()
+        return self._normalize_user_info(self.decode_json(response))
+    
+    @staticmethod
+    def _normalize_user_info(data: Dict[str, any]) -> Dict[str, any]:
+        """Normalize Google's response to our standard format."""
         return {
             'id': data.get('id'),
             'email': data.get('email'),
@@ -72,7 +84,7 @@ class GoogleOAuthProvider(BaseOAuthProvider):
             bool: True if revocation succeeded
         """
         try:
-            response = requests.post(
+            response = self._session.post(
                 self.revoke_url,
                 data={'token': token},
                 timeout=10
@@ -3,11 +3,18 @@
 Microsoft OAuth 2.0 provider implementation (Azure AD / Microsoft Identity Platform).
 """
 
-from typing import Dict
-import requests
+from functools import lru_cache
+from typing import Dict, Tuple
 from .base import BaseOAuthProvider
 
 
+@lru_cache(maxsize=32)
+def _tenant_urls(tenant: str) -> Tuple[str, str]:
+    """Build (authorize_url, token_url) for a tenant, shared across instances."""
+    base = f'https://login.microsoftonline.com/{tenant}/oauth2/v2.0'
+    return base + '/authorize', base + '/token'
+
+
 class MicrosoftOAuthProvider(BaseOAuthProvider):
     """Microsoft OAuth 2.0 provider (Azure AD / Microsoft Account)."""
     
@@ -32,8 +39,7 @@ class MicrosoftOAuthProvider(BaseOAuthProvider):
         
         # Allow custom tenant configuration
         self.tenant = tenant
-        self.authorize_url = f'https://login.microsoftonline.com/{tenant}/oauth2/v2.0/authorize'
-        self.token_url = f'https://login.microsoftonline.com/{tenant}/oauth2/v2.0/token'
+        self.authorize_url, self.token_url = _tenant_urls(tenant)
     
     def get_additional_auth_params(self) -> Dict[str, str]:
         """Add Microsoft-specific parameters."""
@@ -51,21 +57,19 @@ class MicrosoftOAuthProvider(BaseOAuthProvider):
         Returns:
             Dict with normalized user data
         """
-        headers = {
-            'Authorization': f'Bearer {access_token}',
-            'Accept': 'application/json'
-        }
-        
-        response = requests.get(
-            self.userinfo_url,
-            headers=headers,
-            timeout=10
+        return self._normalize_user_info(
+            self.get_json(self.userinfo_url, access_token)
         )
-        
-        response.raise_for_status()
-        data = response.json()
-        
-        # Normalize Microsoft's response to our standard format
+    
+    async def aget_user_info(self, access_token: str) -> Dict[str, any]:
+        """Async variant of get_user_info."""
+        return self._normalize_user_info(
+            await self.aget_json(self.userinfo_url, access_token)
+        )
+    
+    @staticmethod
+    def _normalize_user_info(data: Dict[str, any]) -> Dict[str, any]:
+        """Normalize Microsoft's response to our standard format."""
         return {
             'id': data.get('id'),
             'email': data.get('mail') or data.get('userPrincipalName'),
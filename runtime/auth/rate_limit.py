@@ -4,21 +4,32 @@ Simple rate limiting for OAuth endpoints.
 Uses in-memory storage (suitable for single-server deployments).
 """
 
+import logging
 from functools import wraps
-from datetime import datetime, timedelta, timezone
-from collections import defaultdict
+import time
+from collections import deque
 from threading import Lock
 
+logger = logging.getLogger(__name__)
+
+
+# Number of independently locked shards (must be a power of two)
+_SHARD_COUNT = 16
+
 
 class RateLimiter:
     """
     Simple in-memory rate limiter.
     Tracks requests by IP address and endpoint.
+    
+    Keys are partitioned across shards, each with its own lock, so checks
+    for unrelated IPs/endpoints don't contend on a single global lock.
     """
     
+    __slots__ = ('_shards',)
+    
     def __init__(self):
-        self.requests = defaultdict(list)
-        self.lock = Lock()
+        self._shards = [({}, Lock()) for _ in range(_SHARD_COUNT)]
     
     def is_rate_limited(self, key: str, max_requests: int, window_seconds: int) -> tuple[bool, int]:
         """
@@ -32,31 +43,35 @@ class RateLimiter:
         Returns:
             Tuple of (is_limited, retry_after_seconds)
         """
-        now = datetime.now(timezone.utc)
-        cutoff = now - timedelta(seconds=window_seconds)
+        now = time.monotonic()
+        cutoff = now - window_seconds
+        
+        requests, lock = self._shards[hash(key) & (_SHARD_COUNT - 1)]
         
-        with self.lock:
-            # Clean up old requests
-            self.requests[key] = [
-                timestamp for timestamp in self.requests[key]
-                if timestamp > cutoff
-            ]
+        with lock:
+            # Evict expired requests from the front (timestamps are appended in order)
+            timestamps = requests.get(key)
+            if timestamps is None:
+                timestamps = requests[key] = deque()
+            while timestamps and timestamps[0] <= cutoff:
+                timestamps.popleft()
             
             # Check if limit exceeded
-            if len(self.requests[key]) >= max_requests:
-                # Calculate retry_after
-                oldest_request = min(self.requests[key])
-                retry_after = int((oldest_request + timedelta(seconds=window_seconds) - now).total_seconds())
+            if len(timestamps) >= max_requests:
+                # Calculate retry_after from the oldest request still in the window
+                oldest_request = timestamps[0]
+                retry_after = int(oldest_request + window_seconds - now)
                 return True, max(retry_after, 1)
             
             # Record this request
-            self.requests[key].append(now)
+            timestamps.append(now)
             return False, 0
     
     def clear(self):
         """Clear all rate limit data."""
-        with self.lock:
-            self.requests.clear()
+        for requests, lock in self._shards:
+            with lock:
+                requests.clear()
 
 
 # Global rate limiter instance
@@ -93,7 +108,7 @@ def rate_limit(max_requests: int, window_seconds: int):
             
             if is_limited:
                 # Log rate limit event
-                print(f"Rate limit exceeded for {ip_address} on {endpoint}")
+                logger.warning("Rate limit exceeded for %s on %s", ip_address, endpoint)
                 
                 # Return 429 Too Many Requests
                 abort(429, f"Rate limit exceeded. Try again in {retry_after} seconds.")
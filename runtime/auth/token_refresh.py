@@ -3,17 +3,45 @@
 OAuth token refresh logic and background job.
 """
 
+import logging
 from datetime import timedelta
 from emmett import now
-import traceback
 
+logger = logging.getLogger(__name__)
 
-def refresh_oauth_token(oauth_account):
+
+def _expiring_tokens_query(t, threshold_time):
+    """Tokens with a refresh token whose access token expires by threshold_time."""
+    return (
+        (t.access_token_expires_at != None) &
+        (t.access_token_expires_at <= threshold_time) &
+        (t.refresh_token_encrypted != None)
+    )
+
+
+def _expired_tokens_query(t, current_time, cutoff_date):
+    """Expired tokens that can't be refreshed and haven't been updated since cutoff_date."""
+    return (
+        (t.access_token_expires_at != None) &
+        (t.access_token_expires_at < current_time) &
+        (t.updated_at < cutoff_date) &
+        (
+            (t.refresh_token_encrypted == None) |
+            (
+                (t.refresh_token_expires_at != None) &
+                (t.refresh_token_expires_at < current_time)
+            )
+        )
+    )
+
+
+def refresh_oauth_token(oauth_account, token=None):
     """
     Refresh an OAuth access token if needed.
     
     Args:
         oauth_account: OAuthAccount instance
+        token: OAuthToken for the account, if already loaded (looked up otherwise)
         
     Returns:
         bool: True if refresh succeeded or not needed, False if failed
@@ -22,10 +50,11 @@ def refresh_oauth_token(oauth_account):
         from ..models import OAuthToken
         from .oauth_manager import get_oauth_manager
         
-        # Get token
-        token = OAuthToken.where(lambda t: t.oauth_account == oauth_account.id).first()
+        # Get token unless the caller already fetched it
+        if token is None:
+            token = OAuthToken.where(lambda t: t.oauth_account == oauth_account.id).first()
         if not token:
-            print(f"No token found for OAuth account {oauth_account.id}")
+            logger.warning("No token found for OAuth account %s", oauth_account.id)
             return False
         
         # Check if refresh needed
@@ -35,18 +64,18 @@ def refresh_oauth_token(oauth_account):
         # Check if we have a refresh token
         refresh_token = token.get_refresh_token()
         if not refresh_token:
-            print(f"No refresh token available for OAuth account {oauth_account.id}")
+            logger.warning("No refresh token available for OAuth account %s", oauth_account.id)
             return False
         
         # Get provider instance
         oauth_manager = get_oauth_manager()
         provider_instance = oauth_manager.get_provider(oauth_account.provider)
         if not provider_instance:
-            print(f"Provider {oauth_account.provider} not configured")
+            logger.warning("Provider %s not configured", oauth_account.provider)
             return False
         
         # Refresh the token
-        print(f"Refreshing token for {oauth_account.provider} account {oauth_account.id}")
+        logger.info("Refreshing token for %s account %s", oauth_account.provider, oauth_account.id)
         token_data = provider_instance.refresh_access_token(refresh_token)
         
         # Update stored tokens
@@ -60,21 +89,21 @@ def refresh_oauth_token(oauth_account):
             expires_in
         )
         
-        print(f"Successfully refreshed token for OAuth account {oauth_account.id}")
+        logger.info("Successfully refreshed token for OAuth account %s", oauth_account.id)
         return True
         
     except Exception as e:
-        print(f"Error refreshing OAuth token: {e}")
-        traceback.print_exc()
+        logger.exception("Error refreshing OAuth token: %s", e)
         return False
 
 
-def refresh_expiring_tokens(hours_threshold=2):
+def refresh_expiring_tokens(hours_threshold=2, batch_size=500):
     """
     Refresh all OAuth tokens that are expiring soon.
     
     Args:
         hours_threshold: Refresh tokens expiring within this many hours
+        batch_size: Number of tokens loaded per query
         
     Returns:
         dict: Statistics about the refresh operation
@@ -85,14 +114,6 @@ def refresh_expiring_tokens(hours_threshold=2):
         # Find tokens expiring soon
         threshold_time = now() + timedelta(hours=hours_threshold)
         
-        expiring_tokens = OAuthToken.where(
-            lambda t: (
-                (t.access_token_expires_at != None) &
-                (t.access_token_expires_at <= threshold_time) &
-                (t.refresh_token_encrypted != None)
-            )
-        ).select()
-        
         stats = {
             'total': 0,
             'success': 0,
@@ -100,29 +121,49 @@ def refresh_expiring_tokens(hours_threshold=2):
             'no_refresh_token': 0
         }
         
-        for token in expiring_tokens:
-            stats['total'] += 1
+        # Walk the expiring tokens in id order, one batch at a time, so large
+        # token tables are never fully materialized in memory
+        last_id = 0
+        while True:
+            expiring_tokens = OAuthToken.where(
+                lambda t: _expiring_tokens_query(t, threshold_time) & (t.id > last_id)
+            ).select(orderby=OAuthToken.id, limitby=(0, batch_size))
             
-            # Get OAuth account
-            oauth_account = OAuthAccount.get(token.oauth_account)
-            if not oauth_account:
-                print(f"OAuth account {token.oauth_account} not found")
-                stats['failed'] += 1
-                continue
+            # Load every account referenced by this batch in a single query
+            account_ids = {token.oauth_account for token in expiring_tokens}
+            accounts = {
+                account.id: account
+                for account in OAuthAccount.where(
+                    lambda a: a.id.belongs(account_ids)
+                ).select()
+            } if account_ids else {}
             
-            # Attempt refresh
-            success = refresh_oauth_token(oauth_account)
-            if success:
-                stats['success'] += 1
-            else:
-                stats['failed'] += 1
-        
-        print(f"Token refresh job complete: {stats}")
+            for token in expiring_tokens:
+                last_id = token.id
+                stats['total'] += 1
+                
+                # Get OAuth account
+                oauth_account = accounts.get(token.oauth_account)
+                if not oauth_account:
+                    logger.warning("OAuth account %s not found", token.oauth_account)
+                    stats['failed'] += 1
+                    continue
+                
+                # Attempt refresh
+                success = refresh_oauth_token(oauth_account, token=token)
+                if success:
+                    stats['success'] += 1
+                else:
+                    stats['failed'] += 1
+            
+            if len(expiring_tokens) < batch_size:
+                break
+        
+        logger.info("Token refresh job complete: %s", stats)
         return stats
         
     except Exception as e:
-        print(f"Error in refresh_expiring_tokens: {e}")
-        traceback.print_exc()
+        logger.exception("Error in refresh_expiring_tokens: %s", e)
         return {'error': str(e)}
 
 
@@ -139,41 +180,35 @@ def cleanup_expired_tokens(days_threshold=90):
     try:
         from ..models import OAuthToken
         
-        cutoff_date = now() - timedelta(days=days_threshold)
+        current_time = now()
+        cutoff_date = current_time - timedelta(days=days_threshold)
         
         # Find tokens that are:
         # 1. Expired (access token expired)
         # 2. No refresh token OR refresh token also expired
         # 3. Haven't been updated in days_threshold days
         expired_tokens = OAuthToken.where(
-            lambda t: (
-                (t.access_token_expires_at != None) &
-                (t.access_token_expires_at < now()) &
-                (t.updated_at < cutoff_date) &
-                (
-                    (t.refresh_token_encrypted == None) |
-                    (
-                        (t.refresh_token_expires_at != None) &
-                        (t.refresh_token_expires_at < now())
-                    )
-                )
-            )
-        ).select()
-        
-        count = 0
-        for token in expired_tokens:
-            try:
-                token.delete()
-                count += 1
-            except Exception as e:
-                print(f"Error deleting token {token.id}: {e}")
+            lambda t: _expired_tokens_query(t, current_time, cutoff_date)
+        )
         
-        print(f"Cleaned up {count} expired OAuth tokens")
+        try:
+            # Single set-based DELETE; the ORM reports the affected row count
+            count = expired_tokens.delete()
+        except Exception as e:
+            logger.warning("Bulk delete of expired tokens failed, deleting per row: %s", e)
+            count = 0
+            for token in expired_tokens.select():
+                try:
+                    token.delete()
+                    count += 1
+                except Exception as e:
+                    logger.error("Error deleting token %s: %s", token.id, e)
+        
+        logger.info("Cleaned up %s expired OAuth tokens", count)
         return count
         
     except Exception as e:
-        print(f"Error in cleanup_expired_tokens: {e}")
-        traceback.print_exc()
+        logger.exception("Error in cleanup_expired_tokens: %s", e)
         return 0
 
 
@@ -1,16 +1,66 @@
 # -*- coding: utf-8 -*-
 """
 Token encryption and management utilities for OAuth tokens.
+
+Tokens are encrypted with AES-256-GCM, which OpenSSL runs on AES-NI, under
+a subkey derived from the configured key with HKDF. Tokens stored by earlier
+versions were Fernet-encrypted with the configured key itself and are still
+decrypted transparently.
 """
 
 import os
-from cryptography.fernet import Fernet
-from base64 import urlsafe_b64encode
+from functools import cache
+from threading import Lock
+from typing import List, Sequence, Union
+from cryptography.exceptions import InvalidTag
+from cryptography.fernet import Fernet, InvalidToken
+from cryptography.hazmat.primitives import hashes
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+from cryptography.hazmat.primitives.kdf.hkdf import HKDF
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+
+# Leading byte of AES-GCM tokens (Fernet tokens always start with 0x80)
+_AESGCM_VERSION = b'\x01'
+_NONCE_SIZE = 12
+
+# HKDF context for the AES-GCM subkey, so the Fernet key material is never
+# used directly by a second algorithm
+_AESGCM_KEY_INFO = b'oauth-token-aesgcm'
+
+# Nonces for single-token encryption are sliced from one os.urandom block,
+# refilled when exhausted, instead of a syscall per token
+_NONCE_POOL_SIZE = _NONCE_SIZE * 341  # ~4 KB
+_nonce_pool = b''
+_nonce_offset = 0
+_nonce_lock = Lock()
+
+
+def _reset_nonce_pool():
+    """Discard buffered nonces (a forked child must never reuse the parent's)."""
+    global _nonce_pool, _nonce_offset
+    _nonce_pool = b''
+    _nonce_offset = 0
+
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_reset_nonce_pool)
+
+
+def _next_nonce() -> bytes:
+    """Take the next unused nonce from the pool."""
+    global _nonce_pool, _nonce_offset
+    with _nonce_lock:
+        if _nonce_offset + _NONCE_SIZE > len(_nonce_pool):
+            _nonce_pool = os.urandom(_NONCE_POOL_SIZE)
+            _nonce_offset = 0
+        start = _nonce_offset
+        _nonce_offset += _NONCE_SIZE
+        return _nonce_pool[start:_nonce_offset]
 
 
 def generate_encryption_key():
     """
-    Generate a new Fernet encryption key.
+    Generate a new encryption key (32 random bytes, URL-safe base64).
     This should be called once and the key stored securely in environment variables.
     
     Returns:
@@ -46,24 +96,31 @@ def get_encryption_key():
     return key.encode('utf-8') if isinstance(key, str) else key
 
 
-# Initialize cipher with the encryption key
-_cipher = None
-
-
+@cache
 def _get_cipher():
-    """Get or create the Fernet cipher instance."""
-    global _cipher
-    if _cipher is None:
-        _cipher = Fernet(get_encryption_key())
-    return _cipher
+    """
+    Get the AES-GCM cipher instance, created once on first use.
+    Call _get_cipher.cache_clear() after changing the encryption key.
+    
+    The cipher key is an HKDF-SHA256 subkey of the configured key; the
+    configured key itself is only used for legacy Fernet tokens.
+    """
+    subkey = HKDF(
+        algorithm=hashes.SHA256(),
+        length=32,
+        salt=None,
+        info=_AESGCM_KEY_INFO
+    ).derive(urlsafe_b64decode(get_encryption_key()))
+    return AESGCM(subkey)
 
 
-def encrypt_token(token: str) -> str:
+def encrypt_token(token: Union[str, bytes], return_bytes: bool = False) -> Union[str, bytes]:
     """
     Encrypt an OAuth token for storage.
     
     Args:
-        token: The plaintext token to encrypt
+        token: The plaintext token to encrypt (bytes are used as-is)
+        return_bytes: Return the encrypted token as bytes instead of str
         
     Returns:
         str: The encrypted token (base64 encoded)
@@ -74,17 +131,22 @@ def encrypt_token(token: str) -> str:
     if not token:
         raise ValueError("Cannot encrypt empty token")
     
+    data = token if isinstance(token, (bytes, bytearray)) else token.encode('utf-8')
+    
     cipher = _get_cipher()
-    encrypted = cipher.encrypt(token.encode('utf-8'))
-    return encrypted.decode('utf-8')
+    nonce = _next_nonce()
+    encrypted = cipher.encrypt(nonce, data, None)
+    encoded = urlsafe_b64encode(_AESGCM_VERSION + nonce + encrypted)
+    return encoded if return_bytes else encoded.decode('ascii')
 
 
-def decrypt_token(encrypted_token: str) -> str:
+def decrypt_token(encrypted_token: Union[str, bytes], return_bytes: bool = False) -> Union[str, bytes]:
     """
     Decrypt an OAuth token from storage.
     
     Args:
-        encrypted_token: The encrypted token (base64 encoded)
+        encrypted_token: The encrypted token (base64 encoded, str or bytes)
+        return_bytes: Return the plaintext as bytes instead of str
         
     Returns:
         str: The decrypted plaintext token
@@ -96,7 +158,96 @@ def decrypt_token(encrypted_token: str) -> str:
     if not encrypted_token:
         raise ValueError("Cannot decrypt empty token")
     
+    try:
+        # b64decode takes ASCII str or bytes directly; no encode needed
+        data = urlsafe_b64decode(encrypted_token)
+    except ValueError:
+        raise InvalidToken
+    
+    if data[:1] != _AESGCM_VERSION:
+        # Stored before the switch to AES-GCM
+        legacy_cipher = Fernet(get_encryption_key())
+        decrypted = legacy_cipher.decrypt(encrypted_token)
+    else:
+        cipher = _get_cipher()
+        nonce_end = 1 + _NONCE_SIZE
+        try:
+            decrypted = cipher.decrypt(data[1:nonce_end], data[nonce_end:], None)
+        except (InvalidTag, ValueError):
+            # ValueError: truncated token, too short to hold a nonce
+            raise InvalidToken
+    
+    return decrypted if return_bytes else decrypted.decode('utf-8')
+
+
+def encrypt_tokens(tokens: Sequence[Union[str, bytes]]) -> List[str]:
+    """
+    Encrypt many OAuth tokens at once (e.g. key rotation or bulk import).
+    
+    Reuses one cipher for every token and draws all nonces with a single
+    os.urandom call.
+    
+    Args:
+        tokens: Plaintext tokens to encrypt (bytes are used as-is)
+        
+    Returns:
+        list[str]: Encrypted tokens, in the same order
+        
+    Raises:
+        ValueError: If any token is empty
+    """
+    if not all(tokens):
+        raise ValueError("Cannot encrypt empty token")
+    
     cipher = _get_cipher()
-    decrypted = cipher.decrypt(encrypted_token.encode('utf-8'))
-    return decrypted.decode('utf-8')
+    nonces = os.urandom(_NONCE_SIZE * len(tokens))
+    encrypted = []
+    
+    for i, token in enumerate(tokens):
+        data = token if isinstance(token, (bytes, bytearray)) else token.encode('utf-8')
+        nonce = nonces[i * _NONCE_SIZE:(i + 1) * _NONCE_SIZE]
+        ciphertext = cipher.encrypt(nonce, data, None)
+        encrypted.append(urlsafe_b64encode(_AESGCM_VERSION + nonce + ciphertext).decode('ascii'))
+    
+    return encrypted
+
 
+def decrypt_tokens(encrypted_tokens: Sequence[Union[str, bytes]]) -> List[str]:
+    """
+    Decrypt many OAuth tokens at once.
+    
+    Args:
+        encrypted_tokens: Encrypted tokens (base64 encoded, str or bytes)
+        
+    Returns:
+        list[str]: Plaintext tokens, in the same order
+        
+    Raises:
+        ValueError: If any encrypted token is empty
+        cryptography.fernet.InvalidToken: If a token cannot be decrypted
+    """
+    if not all(encrypted_tokens):
+        raise ValueError("Cannot decrypt empty token")
+    
+    cipher = _get_cipher()
+    nonce_end = 1 + _NONCE_SIZE
+    decrypted = []
+    
+    for encrypted_token in encrypted_tokens:
+        try:
+            data = urlsafe_b64decode(encrypted_token)
+        except ValueError:
+            raise InvalidToken
+        
+        if data[:1] != _AESGCM_VERSION:
+            # Legacy Fernet token
+            decrypted.append(decrypt_token(encrypted_token))
+            continue
+        
+        try:
+            plaintext = cipher.decrypt(data[1:nonce_end], data[nonce_end:], None)
+        except (InvalidTag, ValueError):
+            raise InvalidToken
+        decrypted.append(plaintext.decode('utf-8'))
+    
+    return decrypted
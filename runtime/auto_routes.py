@@ -21,15 +21,28 @@ Usage:
     # In app.py:
     from auto_routes import discover_and_register_auto_routes
     discover_and_register_auto_routes(app, db)
+    
+    # The REST handlers expect db.pipe in app.pipeline to provide the
+    # per-request database connection.
 """
 
-from typing import List, Dict, Any, Optional
-import inspect
+from dataclasses import dataclass, field
+from functools import lru_cache, partial
+from operator import itemgetter
+from types import MappingProxyType
+from typing import Callable, List, Dict, Any, FrozenSet, Mapping
 import logging
-from emmett import App, response as emmett_response
+import sys
+from emmett import App, request, response
 from emmett.orm import Database
 from auto_ui_generator import auto_ui
 
+try:
+    # orjson encodes REST payloads several times faster than stdlib json
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
 logger = logging.getLogger(__name__)
 
 
@@ -37,8 +50,8 @@ def discover_auto_routes_models(db: Database) -> List[type]:
     """
     Discover all models with auto_routes enabled.
     
-    Searches through all BaseModel subclasses and finds those
-    with the `auto_routes` class attribute set.
+    Reads the registry BaseModel fills in as subclasses declaring
+    `auto_routes` are defined, instead of polling every subclass.
     
     Args:
         db: Emmett Database instance
@@ -48,88 +61,40 @@ def discover_auto_routes_models(db: Database) -> List[type]:
     """
     auto_routes_models = []
     
-    # Import BaseModel to get all subclasses
     from base_model import BaseModel
     
-    # Get all BaseModel subclasses
-    all_models = BaseModel.__subclasses__()
+    registered_models = BaseModel._auto_routes_registry
     
-    print(f"DEBUG: Found {len(all_models)} BaseModel subclasses")
-    print(f"DEBUG: Models: {[m.__name__ for m in all_models]}")
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(
+            "Found %d BaseModel subclasses with auto_routes: %s",
+            len(registered_models), [m.__name__ for m in registered_models]
+        )
     
-    if not all_models:
-        print("WARNING: No BaseModel subclasses found")
-        logger.warning("No BaseModel subclasses found")
+    if not registered_models:
+        logger.warning("No BaseModel subclasses with auto_routes found")
         return []
     
-    print(f"INFO: Scanning {len(all_models)} BaseModel subclasses for auto_routes...")
-    logger.info(f"Scanning {len(all_models)} BaseModel subclasses for auto_routes...")
-    
-    # Iterate through all model classes
-    for model_class in all_models:
-        print(f"DEBUG: Checking {model_class.__name__}")
-        
-        # Check if model has auto_routes attribute
-        if not hasattr(model_class, 'auto_routes'):
-            print(f"DEBUG: {model_class.__name__} - no auto_routes attribute")
-            continue
-        
-        auto_routes_config = getattr(model_class, 'auto_routes')
-        print(f"DEBUG: {model_class.__name__} - auto_routes = {auto_routes_config}")
-        
-        # Skip if explicitly disabled
-        if auto_routes_config is False:
-            print(f"INFO: Skipping {model_class.__name__} - auto_routes disabled")
-            logger.info(f"Skipping {model_class.__name__} - auto_routes disabled")
-            continue
-        
+    for model_class in registered_models:
         # Skip if model has manual setup() in module
         if _has_manual_setup(model_class):
-            print(f"INFO: Skipping {model_class.__name__} - has manual setup()")
-            logger.info(f"Skipping {model_class.__name__} - has manual setup()")
+            logger.info("Skipping %s - has manual setup()", model_class.__name__)
             continue
         
         auto_routes_models.append(model_class)
-        print(f"✓ Discovered auto_routes model: {model_class.__name__}")
-        logger.info(f"✓ Discovered auto_routes model: {model_class.__name__}")
+        logger.info("✓ Discovered auto_routes model: %s", model_class.__name__)
     
     return auto_routes_models
 
 
-def _find_model_for_table(db: Database, table_name: str) -> Optional[type]:
-    """
-    Find the model class associated with a database table.
-    
-    Args:
-        db: Database instance
-        table_name: Name of the table
-    
-    Returns:
-        Model class or None if not found
-    """
-    # Try to find model in db._models (if it exists)
-    if hasattr(db, '_models'):
-        for model in db._models.values():
-            if hasattr(model, 'tablename') and model.tablename == table_name:
-                return model
-    
-    # Fallback: search through Model subclasses
-    from base_model import BaseModel
-    for subclass in BaseModel.__subclasses__():
-        if hasattr(subclass, 'tablename') and subclass.tablename == table_name:
-            return subclass
-        # Also check if tablename defaults to class name
-        if not hasattr(subclass, 'tablename'):
-            if subclass.__name__.lower() == table_name:
-                return subclass
-    
-    return None
-
-
+@lru_cache(maxsize=None)
 def _has_manual_setup(model_class: type) -> bool:
     """
     Check if model has a manual setup() function defined.
     
+    Only call once the model's module has finished importing; the result
+    is cached per class.
+    
     Args:
         model_class: Model class to check
     
@@ -137,97 +102,100 @@ def _has_manual_setup(model_class: type) -> bool:
         True if manual setup exists, False otherwise
     """
     # Check if model's module defines a setup function
-    model_module = inspect.getmodule(model_class)
+    # (direct sys.modules lookup; inspect.getmodule may scan every module)
+    model_module = sys.modules.get(model_class.__module__)
     if model_module and hasattr(model_module, 'setup'):
         return True
     
     return False
 
 
-def parse_auto_routes_config(model_class: type) -> Dict[str, Any]:
+_DEFAULT_ACTIONS = ('list', 'detail', 'create', 'update', 'delete')
+_VALID_ACTIONS = frozenset(_DEFAULT_ACTIONS)
+
+_EMPTY_MAPPING: Mapping[str, Any] = MappingProxyType({})
+
+
+@dataclass(frozen=True)
+class AutoRoutesConfig:
+    """Normalized, read-only auto_routes configuration for one model."""
+    url_prefix: str
+    rest_prefix: str
+    enabled: bool = True
+    rest_api: bool = True
+    enabled_actions: FrozenSet[str] = _VALID_ACTIONS
+    permissions: Mapping[str, Callable] = field(default_factory=lambda: _EMPTY_MAPPING)
+    auto_ui_config: Mapping[str, Any] = field(default_factory=lambda: _EMPTY_MAPPING)
+    custom_handlers: Mapping[str, Callable] = field(default_factory=lambda: _EMPTY_MAPPING)
+
+
+def parse_auto_routes_config(model_class: type) -> AutoRoutesConfig:
     """
     Parse and normalize auto_routes configuration from model.
     
+    auto_routes is a class attribute, so the result is computed once per
+    model class and cached.
+    
     Args:
         model_class: Model class with auto_routes attribute
     
     Returns:
-        Normalized configuration dictionary
+        Normalized configuration
     """
+    return _parse_auto_routes_config_cached(model_class)
+
+
+@lru_cache(maxsize=None)
+def _parse_auto_routes_config_cached(model_class: type) -> AutoRoutesConfig:
+    """Build the normalized auto_routes configuration for a model class."""
     auto_routes = getattr(model_class, 'auto_routes', None)
-    
-    # Default configuration
-    default_config = {
-        'enabled': True,
-        'url_prefix': f'/{model_class.tablename}',
-        'rest_api': True,
-        'rest_prefix': f'/api/{model_class.tablename}',
-        'enabled_actions': ['list', 'detail', 'create', 'update', 'delete'],
-        'permissions': {},
-        'auto_ui_config': {},
-        'custom_handlers': {}
-    }
-    
-    # If auto_routes is just True, use all defaults
-    if auto_routes is True:
-        return default_config
-    
-    # If auto_routes is a dictionary, merge with defaults
-    if isinstance(auto_routes, dict):
-        config = default_config.copy()
-        
-        # Update top-level keys
-        for key in ['url_prefix', 'rest_api', 'rest_prefix', 'enabled_actions']:
-            if key in auto_routes:
-                config[key] = auto_routes[key]
-        
-        # Merge nested dicts
-        if 'permissions' in auto_routes:
-            config['permissions'].update(auto_routes['permissions'])
-        if 'auto_ui_config' in auto_routes:
-            config['auto_ui_config'].update(auto_routes['auto_ui_config'])
-        if 'custom_handlers' in auto_routes:
-            config['custom_handlers'].update(auto_routes['custom_handlers'])
-        
-        return config
-    
-    # If auto_routes is neither True nor dict, use defaults
-    return default_config
+    tablename = model_class.tablename  # type: ignore[attr-defined]
+    
+    # True (or anything else but a dict) uses all defaults
+    if not isinstance(auto_routes, dict):
+        return AutoRoutesConfig(url_prefix='/' + tablename, rest_prefix='/api/' + tablename)
+    
+    return AutoRoutesConfig(
+        url_prefix=auto_routes.get('url_prefix', '/' + tablename),
+        rest_prefix=auto_routes.get('rest_prefix', '/api/' + tablename),
+        enabled=auto_routes.get('enabled', True),
+        rest_api=auto_routes.get('rest_api', True),
+        enabled_actions=frozenset(auto_routes.get('enabled_actions', _DEFAULT_ACTIONS)),
+        permissions=MappingProxyType(dict(auto_routes.get('permissions', {}))),
+        auto_ui_config=MappingProxyType(dict(auto_routes.get('auto_ui_config', {}))),
+        custom_handlers=MappingProxyType(dict(auto_routes.get('custom_handlers', {}))),
+    )
 
 
-def validate_auto_routes_config(model_class: type, config: Dict[str, Any]) -> None:
+def validate_auto_routes_config(model_class: type, config: AutoRoutesConfig) -> None:
     """
     Validate auto_routes configuration and warn about issues.
     
     Args:
         model_class: Model class
-        config: Configuration dictionary
+        config: Normalized configuration
     """
-    valid_actions = ['list', 'detail', 'create', 'update', 'delete']
-    
     # Check enabled_actions
-    enabled_actions = config.get('enabled_actions', [])
-    for action in enabled_actions:
-        if action not in valid_actions:
-            logger.warning(
-                f"{model_class.__name__}: Invalid action '{action}' in enabled_actions. "
-                f"Valid actions: {valid_actions}"
-            )
+    invalid_actions = config.enabled_actions - _VALID_ACTIONS
+    for action in invalid_actions:
+        logger.warning(
+            "%s: Invalid action '%s' in enabled_actions. Valid actions: %s",
+            model_class.__name__, action, list(_DEFAULT_ACTIONS)
+        )
     
     # Check permissions
-    permissions = config.get('permissions', {})
-    for action, permission_func in permissions.items():
-        if action not in valid_actions:
+    for action, permission_func in config.permissions.items():
+        if action not in _VALID_ACTIONS:
             logger.warning(
-                f"{model_class.__name__}: Permission defined for invalid action '{action}'"
+                "%s: Permission defined for invalid action '%s'", model_class.__name__, action
             )
         if not callable(permission_func):
             logger.warning(
-                f"{model_class.__name__}: Permission for '{action}' is not callable"
+                "%s: Permission for '%s' is not callable", model_class.__name__, action
             )
 
 
-def generate_routes_for_model(app: App, model_class: type, config: Dict[str, Any]) -> None:
+def generate_routes_for_model(app: App, model_class: type, config: AutoRoutesConfig) -> None:
     """
     Generate and register routes for a single model.
     
@@ -239,14 +207,12 @@ def generate_routes_for_model(app: App, model_class: type, config: Dict[str, Any
         model_class: Model class to generate routes for
         config: Auto routes configuration
     """
-    url_prefix = config['url_prefix']
-    enabled_actions = config['enabled_actions']
-    auto_ui_config = config['auto_ui_config']
+    url_prefix = config.url_prefix
     
     # Build auto_ui config with permissions and enabled actions
     ui_config = {
-        'permissions': config['permissions'],
-        **auto_ui_config
+        'permissions': config.permissions,
+        **config.auto_ui_config
     }
     
     # If enabled_actions is limited, we need to customize the generator
@@ -255,116 +221,260 @@ def generate_routes_for_model(app: App, model_class: type, config: Dict[str, Any
     
     try:
         # Generate CRUD routes via auto_ui
-        print(f"INFO: Generating routes for {model_class.__name__} at {url_prefix}")
-        logger.info(f"Generating routes for {model_class.__name__} at {url_prefix}")
+        logger.info("Generating routes for %s at %s", model_class.__name__, url_prefix)
         auto_ui(app, model_class, url_prefix, ui_config)
         
         # Generate REST API if enabled
-        if config['rest_api']:
-            rest_prefix = config['rest_prefix']
-            print(f"INFO: Generating REST API for {model_class.__name__} at {rest_prefix}")
-            logger.info(f"Generating REST API for {model_class.__name__} at {rest_prefix}")
-            _generate_rest_api(app, model_class, rest_prefix, enabled_actions)
+        if config.rest_api:
+            rest_prefix = config.rest_prefix
+            logger.info("Generating REST API for %s at %s", model_class.__name__, rest_prefix)
+            _generate_rest_api(app, model_class, rest_prefix, config.enabled_actions)
         
-        print(f"✓ Successfully registered routes for {model_class.__name__}")
-        logger.info(f"Successfully registered routes for {model_class.__name__}")
+        logger.info("Successfully registered routes for %s", model_class.__name__)
         
     except Exception as e:
-        print(f"ERROR: Failed to generate routes for {model_class.__name__}: {e}")
-        logger.error(f"Failed to generate routes for {model_class.__name__}: {e}")
+        logger.error("Failed to generate routes for %s: %s", model_class.__name__, e)
         raise
 
 
-def _generate_rest_api(app: App, model_class: type, rest_prefix: str, enabled_actions: List[str]) -> None:
+# Bounded: ?fields= projections produce client-chosen name tuples
+@lru_cache(maxsize=256)
+def _row_serializer(field_names: tuple) -> Callable:
+    """
+    Build a record-to-dict serializer for a fixed tuple of field names.
+    
+    Args:
+        field_names: Names of the fields to emit, in order
+    
+    Returns:
+        Function mapping a record to a dict of those field values
+    """
+    # itemgetter reads every column of a record in a single C-level call
+    get_values = itemgetter(*field_names)
+    
+    if len(field_names) == 1:
+        # itemgetter with one key returns the bare value, not a tuple
+        def serialize(record, _name=field_names[0]):
+            return {_name: get_values(record)}
+    else:
+        def serialize(record, _fields=field_names, _get=get_values):
+            return dict(zip(_fields, _get(record)))
+    
+    return serialize
+
+
+def _build_serializer(model_class: type):
+    """
+    Build a record-to-dict serializer specialized for a model's fields.
+    
+    The field names are resolved once at route registration, so serializing
+    a record is one batched column read zipped against the names instead of
+    per-row introspection.
+    
+    Args:
+        model_class: Model class
+    
+    Returns:
+        Function mapping a record to a dict of its field values
+    """
+    return _row_serializer(tuple(model_class.table.fields))  # type: ignore[attr-defined]
+
+
+if orjson is not None:
+    _REST_OUTPUT = 'bytes'
+    
+    def _render(payload: Dict[str, Any], status: int = 200) -> Any:
+        """Encode a REST payload with orjson and set the response status."""
+        response.status = status
+        response.headers['content-type'] = 'application/json'
+        return orjson.dumps(payload, default=str)
+else:
+    _REST_OUTPUT = 'json'
+    
+    def _render(payload: Dict[str, Any], status: int = 200) -> Any:
+        """Set the response status and leave encoding to Emmett's json output."""
+        response.status = status
+        return payload
+
+
+# Pagination bounds for list endpoints
+_DEFAULT_PER_PAGE = 50
+_MAX_PER_PAGE = 500
+
+
+def _int_param(name: str, default: int) -> int:
+    """Read a positive integer query parameter, falling back to default."""
+    try:
+        value = int(request.query_params.get(name, default))  # type: ignore[arg-type]
+    except (TypeError, ValueError):
+        return default
+    return value if value > 0 else default
+
+
+# REST handler implementations, shared by every model. _generate_rest_api
+# binds each one to a model with _bind_handler. Writes are committed by
+# db.pipe when the request succeeds (rolled back on failure), so handlers
+# don't commit themselves.
+
+async def _api_list(model_class: type, serialize: Callable) -> Any:
+    """GET /api/model?page=&per_page=&fields="""
+    page = _int_param('page', 1)
+    per_page = min(_int_param('per_page', _DEFAULT_PER_PAGE), _MAX_PER_PAGE)
+    offset = (page - 1) * per_page
+    table = model_class.table  # type: ignore[attr-defined]
+    
+    # Optional column projection: ?fields=id,name
+    fields = ()
+    requested = request.query_params.get('fields')
+    if requested:
+        fields = tuple(
+            name for name in dict.fromkeys(requested.split(','))  # type: ignore[union-attr]
+            if name in table.fields
+        )
+    if fields:
+        serialize = _row_serializer(fields)
+        columns = [table[name] for name in fields]
+    else:
+        columns = []
+    
+    # iterselect builds each row off the cursor as it is serialized, so the
+    # page is never held as a full Rows object alongside the payload
+    records = model_class.all().iterselect(  # type: ignore[attr-defined]
+        *columns, orderby=table.id, limitby=(offset, offset + per_page)
+    )
+    return _render({
+        'status': 'success',
+        'data': [serialize(record) for record in records],
+        'page': page,
+        'per_page': per_page
+    })
+
+
+async def _api_detail(get: Callable, serialize: Callable, id: int) -> Any:
+    """GET /api/model/:id"""
+    record = get(id)
+    if not record:
+        return _render({'status': 'error', 'message': 'Not found'}, 404)
+    return _render({
+        'status': 'success',
+        'data': serialize(record)
+    })
+
+
+async def _api_create(create: Callable, serialize: Callable) -> Any:
+    """POST /api/model"""
+    data = await request.body_params
+    record = create(**data)
+    return _render({
+        'status': 'success',
+        'data': serialize(record)
+    }, 201)
+
+
+async def _api_update(get: Callable, serialize: Callable, id: int) -> Any:
+    """PUT /api/model/:id"""
+    record = get(id)
+    if not record:
+        return _render({'status': 'error', 'message': 'Not found'}, 404)
+    
+    data = await request.body_params
+    record.update_record(**data)
+    return _render({
+        'status': 'success',
+        'data': serialize(record)
+    })
+
+
+async def _api_delete(get: Callable, id: int) -> Any:
+    """DELETE /api/model/:id"""
+    record = get(id)
+    if not record:
+        return _render({'status': 'error', 'message': 'Not found'}, 404)
+    
+    record.delete_record()
+    return _render({
+        'status': 'success',
+        'message': 'Deleted successfully'
+    })
+
+
+def _bind_handler(impl: Callable, name: str, **bound: Any) -> Callable:
+    """
+    Bind a shared REST handler to one model as a route-ready callable.
+    
+    The partial keeps the per-model arguments in its keywords rather than in
+    closure cells; the function metadata Emmett reads (name, module, doc) is
+    copied over from the implementation.
+    
+    Args:
+        impl: Shared handler coroutine (e.g. _api_list)
+        name: Function name to expose to the router
+        **bound: Per-model arguments to bind
+    
+    Returns:
+        Partial of impl carrying the given name
+    """
+    handler = partial(impl, **bound)
+    for attr in ('__module__', '__doc__'):
+        setattr(handler, attr, getattr(impl, attr))
+    handler.__name__ = handler.__qualname__ = name  # type: ignore[attr-defined]
+    return handler
+
+
+def _generate_rest_api(app: App, model_class: type, rest_prefix: str, enabled_actions: FrozenSet[str]) -> None:
     """
     Generate REST API endpoints for a model.
     
+    Handlers run inside the request's connection and transaction opened by
+    db.pipe in the app pipeline, so they don't open or commit their own.
+    
     Args:
         app: Emmett application instance
         model_class: Model class
         rest_prefix: URL prefix for REST endpoints (e.g., '/api/roles')
-        enabled_actions: List of enabled actions
+        enabled_actions: Set of enabled actions
     """
-    # Get database instance from model
-    db = model_class.db
+    serialize = _build_serializer(model_class)
+    
+    # Route paths and names, computed once per model
+    tablename = model_class.tablename  # type: ignore[attr-defined]
+    names = {action: f'{tablename}_api_{action}' for action in enabled_actions}
+    list_path = rest_prefix
+    item_path = rest_prefix + '/<int:id>'
+    
+    # Model entry points resolved once here instead of on every request
+    get = model_class.get  # type: ignore[attr-defined]
+    create = model_class.create  # type: ignore[attr-defined]
     
     # LIST endpoint: GET /api/model
     if 'list' in enabled_actions:
-        @app.route(f"{rest_prefix}", methods=['get'], output='json', name=f'{model_class.tablename}_api_list')
-        async def api_list():
-            with db.connection():
-                records = model_class.all().select()
-                return {
-                    'status': 'success',
-                    'data': [record.as_dict() for record in records]
-                }
+        app.route(list_path, methods=['get'], output=_REST_OUTPUT, name=names['list'])(
+            _bind_handler(_api_list, 'api_list', model_class=model_class, serialize=serialize)
+        )
     
     # DETAIL endpoint: GET /api/model/:id
     if 'detail' in enabled_actions:
-        @app.route(f"{rest_prefix}/<int:id>", methods=['get'], output='json', name=f'{model_class.tablename}_api_detail')
-        async def api_detail(id):
-            from emmett import response
-            with db.connection():
-                record = model_class.get(id)
-                if not record:
-                    response.status = 404
-                    return {'status': 'error', 'message': 'Not found'}
-                return {
-                    'status': 'success',
-                    'data': record.as_dict()
-                }
+        app.route(item_path, methods=['get'], output=_REST_OUTPUT, name=names['detail'])(
+            _bind_handler(_api_detail, 'api_detail', get=get, serialize=serialize)
+        )
     
     # CREATE endpoint: POST /api/model
     if 'create' in enabled_actions:
-        @app.route(f"{rest_prefix}", methods=['post'], output='json', name=f'{model_class.tablename}_api_create')
-        async def api_create():
-            from emmett import request, response
-            with db.connection():
-                data = await request.body_params
-                record = model_class.create(**data)  # type: ignore[arg-type]
-                db.commit()
-                response.status = 201
-                return {
-                    'status': 'success',
-                    'data': record.as_dict()
-                }
+        app.route(list_path, methods=['post'], output=_REST_OUTPUT, name=names['create'])(
+            _bind_handler(_api_create, 'api_create', create=create, serialize=serialize)
+        )
     
     # UPDATE endpoint: PUT /api/model/:id
     if 'update' in enabled_actions:
-        @app.route(f"{rest_prefix}/<int:id>", methods=['put'], output='json', name=f'{model_class.tablename}_api_update')
-        async def api_update(id):
-            from emmett import request, response
-            with db.connection():
-                record = model_class.get(id)
-                if not record:
-                    response.status = 404
-                    return {'status': 'error', 'message': 'Not found'}
-                
-                data = await request.body_params
-                record.update_record(**data)  # type: ignore[arg-type]
-                db.commit()
-                return {
-                    'status': 'success',
-                    'data': record.as_dict()
-                }
+        app.route(item_path, methods=['put'], output=_REST_OUTPUT, name=names['update'])(
+            _bind_handler(_api_update, 'api_update', get=get, serialize=serialize)
+        )
     
     # DELETE endpoint: DELETE /api/model/:id
     if 'delete' in enabled_actions:
-        @app.route(f"{rest_prefix}/<int:id>", methods=['delete'], output='json', name=f'{model_class.tablename}_api_delete')
-        async def api_delete(id):
-            from emmett import response
-            with db.connection():
-                record = model_class.get(id)
-                if not record:
-                    response.status = 404
-                    return {'status': 'error', 'message': 'Not found'}
-                
-                record.delete_record()
-                db.commit()
-                return {
-                    'status': 'success',
-                    'message': 'Deleted successfully'
-                }
+        app.route(item_path, methods=['delete'], output=_REST_OUTPUT, name=names['delete'])(
+            _bind_handler(_api_delete, 'api_delete', get=get)
+        )
 
 
 def discover_and_register_auto_routes(app: App, db: Database) -> None:
@@ -380,43 +490,58 @@ def discover_and_register_auto_routes(app: App, db: Database) -> None:
         app: Emmett application instance
         db: Database instance
     """
-    print("INFO: Starting automatic route discovery...")
     logger.info("Starting automatic route discovery...")
     
     # Discover models with auto_routes
     models = discover_auto_routes_models(db)
     
-    print(f"INFO: Discovered {len(models)} models with auto_routes")
-    
     if not models:
-        print("INFO: No models with auto_routes found")
         logger.info("No models with auto_routes found")
         return
     
-    print(f"INFO: Found {len(models)} models with auto_routes enabled: {[m.__name__ for m in models]}")
-    logger.info(f"Found {len(models)} models with auto_routes enabled")
+    logger.info("Found %d models with auto_routes enabled", len(models))
+    
+    # Failures are collected and reported once; other models still register
+    failures = []
     
-    # Register routes for each model
+    # Parse and validate every configuration before touching the router
+    configs = []
     for model_class in models:
         try:
-            # Parse configuration
             config = parse_auto_routes_config(model_class)
-            
-            # Validate configuration
             validate_auto_routes_config(model_class, config)
-            
-            # Generate and register routes
-            generate_routes_for_model(app, model_class, config)
-            
         except Exception as e:
-            logger.error(f"Failed to register routes for {model_class.__name__}: {e}")
-            # Continue with other models
+            failures.append((model_class, e))
+            continue
+        if not config.enabled:
+            logger.info("Skipping %s - auto_routes disabled", model_class.__name__)
             continue
+        configs.append((model_class, config))
+    
+    # Register routes for each model (the route table isn't thread-safe)
+    for model_class, config in configs:
+        try:
+            generate_routes_for_model(app, model_class, config)
+        except Exception as e:
+            failures.append((model_class, e))
+    
+    if failures:
+        logger.error(
+            "Failed to register routes for %d of %d models: %s",
+            len(failures), len(models),
+            ', '.join(f'{m.__name__} ({e})' for m, e in failures)
+        )
+        if logger.isEnabledFor(logging.DEBUG):
+            for model_class, e in failures:
+                logger.debug(
+                    "Route registration failure for %s", model_class.__name__, exc_info=e
+                )
     
     logger.info("Automatic route registration complete")
 
 
 __all__ = [
+    'AutoRoutesConfig',
     'discover_auto_routes_models',
     'discover_and_register_auto_routes',
     'parse_auto_routes_config',
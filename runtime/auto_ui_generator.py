@@ -14,13 +14,54 @@ Automatically generates CRUD interfaces from Emmett ORM models with:
 import json
 import os
 from datetime import datetime, date, time
-from functools import wraps
+from functools import cached_property, reduce, wraps
+from operator import or_
 
 from emmett import request, redirect, url, abort, session
 from emmett.orm import Field
 from emmett.forms import Form
 
 
+# Map pyDAL types to UI mapping types
+# Note: Emmett/pyDAL already uses short names (bool, int, etc.)
+# but we include both long and short forms for compatibility
+_FIELD_TYPE_MAP = {
+    'string': 'string',
+    'text': 'text',
+    'blob': 'text',
+    'bool': 'bool',
+    'boolean': 'bool',
+    'int': 'int',
+    'integer': 'int',
+    'bigint': 'int',
+    'float': 'float',
+    'double': 'float',
+    'decimal': 'float',
+    'date': 'date',
+    'time': 'time',
+    'datetime': 'datetime',
+    'password': 'password',
+    'upload': 'file',
+    'reference': 'belongs_to',
+}
+
+
+# Display formats for the value formatters
+_DATETIME_FORMAT = '%b %d, %Y %I:%M %p'
+_DATE_FORMAT = '%b %d, %Y'
+_TIME_FORMAT = '%I:%M %p'
+_BOOLEAN_LABELS = {True: '✓ Yes', False: '✗ No'}
+
+# Stand-in record id reversed into per-record URL format strings
+_URL_ID_PLACEHOLDER = 918273645
+
+# Templates used by the generated routes
+_TEMPLATE_NAMES = ('list.html', 'form.html', 'detail.html', 'delete.html')
+
+# Loaded UIMappingLoader instances keyed by (default_path, custom_path)
+_MAPPING_CACHE = {}
+
+
 class UIMappingLoader:
     """
     Loads and manages UI mappings from JSON configuration files.
@@ -34,6 +75,20 @@ class UIMappingLoader:
         self.mappings = {}
         self.formatters = {}
     
+    @classmethod
+    def get(cls, default_path='ui_mapping.json', custom_path='ui_mapping_custom.json'):
+        """
+        Return a loaded mapping for these files, shared across the process.
+        
+        The JSON files are read once per (default_path, custom_path) pair;
+        later calls reuse the same loader.
+        """
+        key = (default_path, custom_path)
+        loader = _MAPPING_CACHE.get(key)
+        if loader is None:
+            loader = _MAPPING_CACHE.setdefault(key, cls(default_path, custom_path).load())
+        return loader
+    
     def load(self):
         """Load and merge UI mappings from JSON files."""
         self._load_defaults()
@@ -154,12 +209,57 @@ class AutoUIGenerator:
         self.url_prefix = url_prefix.rstrip('/')
         self.model_name = model.__name__.lower()
         self.config = self._merge_config(model, config)
-        self.ui_mapping = UIMappingLoader(
-            default_path=os.path.join(os.path.dirname(__file__), 'ui_mapping.json'),
-            custom_path=os.path.join(os.path.dirname(__file__), 'ui_mapping_custom.json')
-        ).load()
         # Get database instance from model's table
         self.db = model.db
+        # Reference fields resolved once: {field_name: referenced table}
+        self._ref_fields = self._get_reference_fields()
+        # Field introspection doesn't change at runtime, so do it once
+        self._fields = tuple(
+            key for key, value in model.__dict__.items() if isinstance(value, Field)
+        )
+        self._field_types = {
+            name: _FIELD_TYPE_MAP.get(getattr(model, name)._type, 'string')
+            for name in self._fields
+        }
+        # Hidden field names, so hidden checks are a set lookup
+        self._hidden_fields = self._get_hidden_fields()
+        # Route names, built once and shared by registration and url() calls
+        self._route_names = {
+            action: f"{self.model_name}_{action}"
+            for action in ('list', 'new', 'create', 'detail', 'edit', 'update',
+                           'delete_confirm', 'delete_action')
+        }
+        # Searchable fields resolved once for the list view
+        self._search_fields = tuple(
+            getattr(model, field_name) for field_name in self.config['search_fields']
+            if hasattr(model, field_name)
+        )
+        # Custom-vs-default template paths, probed once instead of per request
+        self._template_paths = {
+            template_name: self._resolve_template(template_name)
+            for template_name in _TEMPLATE_NAMES
+        }
+    
+    @cached_property
+    def ui_mapping(self):
+        """UI mappings, loaded on first use rather than at construction."""
+        return UIMappingLoader.get(
+            default_path=os.path.join(os.path.dirname(__file__), 'ui_mapping.json'),
+            custom_path=os.path.join(os.path.dirname(__file__), 'ui_mapping_custom.json')
+        )
+    
+    @cached_property
+    def _formatters(self):
+        """Bound formatter per field, resolved on first use."""
+        return {
+            name: self._resolve_formatter(field_type)
+            for name, field_type in self._field_types.items()
+        }
+    
+    @cached_property
+    def _default_formatter(self):
+        """Formatter for fields without a known type (treated as 'string')."""
+        return self._resolve_formatter('string')
     
     def _merge_config(self, model, config):
         """Merge model auto_ui_config with provided config."""
@@ -180,25 +280,21 @@ class AutoUIGenerator:
             'field_config': {}
         }
         
-        # Merge with model's auto_ui_config if it exists
-        if hasattr(model, 'auto_ui_config'):
-            model_config = model.auto_ui_config
-            default_config.update(model_config)
-            # Merge nested dicts
-            if 'permissions' in model_config:
-                default_config['permissions'].update(model_config['permissions'])
-            if 'field_config' in model_config:
-                default_config['field_config'].update(model_config['field_config'])
-        
-        # Merge with provided config
-        if config:
-            default_config.update(config)
-            if 'permissions' in config:
-                default_config['permissions'].update(config['permissions'])
-            if 'field_config' in config:
-                default_config['field_config'].update(config['field_config'])
+        # Layer the model's auto_ui_config, then the provided config, on top.
+        # Nested dicts are merged into fresh copies so neither source is
+        # mutated (a shared permissions dict would otherwise leak between
+        # generators).
+        model_config = getattr(model, 'auto_ui_config', None) or {}
+        config = config or {}
+        merged = {**default_config, **model_config, **config}
+        for key in ('permissions', 'field_config'):
+            merged[key] = {
+                **default_config[key],
+                **model_config.get(key, {}),
+                **config.get(key, {})
+            }
         
-        return default_config
+        return merged
     
     def register_routes(self):
         """Register all CRUD routes with the app."""
@@ -215,6 +311,52 @@ class AutoUIGenerator:
             return perm_func()
         return True  # Default allow if no permission configured
     
+    def _check_permissions_batch(self, operations):
+        """
+        Check several operations at once, returning {operation: bool}.
+        
+        Operations configured with the same permission callable share a
+        single call, so e.g. one auth lookup can cover several buttons.
+        """
+        permissions = self.config['permissions']
+        results = {}
+        by_callable = {}
+        for operation in operations:
+            perm_func = permissions.get(operation)
+            if perm_func and callable(perm_func):
+                key = id(perm_func)
+                if key not in by_callable:
+                    by_callable[key] = perm_func()
+                results[operation] = by_callable[key]
+            else:
+                results[operation] = True  # Default allow if no permission configured
+        return results
+    
+    def _enforce_permission(self, operation):
+        """Abort (403) or redirect to login unless operation is permitted."""
+        if not self._check_permission(operation):
+            if session.auth:
+                abort(403)
+            redirect(url('auth/login'))
+    
+    def _record_url_format(self, route_name):
+        """
+        Reverse a per-record route once, as a format string for the id.
+        
+        Built per request (url() depends on the request context); rows then
+        use str.format instead of a full url() reversal each.
+        """
+        placeholder = str(_URL_ID_PLACEHOLDER)
+        path = url(route_name, _URL_ID_PLACEHOLDER)
+        return path.replace('{', '{{').replace('}', '}}').replace(placeholder, '{}')
+    
+    def _get_record_or_404(self, record_id, message):
+        """Load a record by id, aborting with 404 if it doesn't exist."""
+        record = self.db(self.model.id == record_id).select().first()
+        if not record:
+            abort(404, message)
+        return record
+    
     def _require_permission(self, operation):
         """Decorator to require permission for a route."""
         def decorator(f):
@@ -231,70 +373,106 @@ class AutoUIGenerator:
     
     def _register_list_route(self):
         """Create and register list view route."""
-        @self.app.route(f"{self.url_prefix}/", name=f"{self.model_name}_list")
+        names = self._route_names
+        list_template = self._get_template('list.html')
+        display_name = self.config['display_name']
+        per_page = self.config['page_size']
+        sort_default = self.config['sort_default']
+        table = self.model.table
+        table_fields = frozenset(table.fields)
+        
+        # Determine which columns to show
+        list_columns = self.config['list_columns']
+        if not list_columns:
+            # Show all fields except hidden ones
+            list_columns = [f for f in self._get_model_fields() 
+                           if not self._is_field_hidden(f)]
+        
+        # Select only the columns the page renders (plus id); fall back to
+        # every column if a list column isn't a table field
+        if table_fields.issuperset(list_columns):
+            select_fields = [table.id] + [table[c] for c in list_columns if c != 'id']
+        else:
+            select_fields = []
+        
+        @self.app.route(f"{self.url_prefix}/", name=names['list'])
         async def list_view():
-            if not self._check_permission('list'):
-                if session.auth:
-                    abort(403)
-                redirect(url('auth/login'))
+            self._enforce_permission('list')
             
             # Pagination
             page = int(request.query_params.get('page', 1))  # type: ignore[arg-type]
-            per_page = self.config['page_size']
             
             # Build query
             query = self.db(self.model)
             
             # Search
             search_query = request.query_params.get('q', '').strip()  # type: ignore[union-attr]
-            if search_query and self.config['search_fields']:
-                search_conditions = []
-                for field_name in self.config['search_fields']:
-                    if hasattr(self.model, field_name):
-                        field = getattr(self.model, field_name)
-                        search_conditions.append(field.contains(search_query))
-                if search_conditions:
-                    # Combine with OR
-                    combined = search_conditions[0]
-                    for condition in search_conditions[1:]:
-                        combined = combined | condition
-                    query = query.where(combined)
+            if search_query and self._search_fields:
+                # Combine with OR
+                query = query.where(reduce(
+                    or_, (field.contains(search_query) for field in self._search_fields)
+                ))
             
-            # Sorting
-            sort_field = request.query_params.get('sort', self.config['sort_default'])
-            if sort_field.startswith('-'):  # type: ignore[union-attr]
-                # Descending
-                sort_field_name = sort_field[1:]  # type: ignore[index]
-                if hasattr(self.model, sort_field_name):  # type: ignore[arg-type]
-                    query = query.select(orderby=~getattr(self.model, sort_field_name))  # type: ignore[arg-type]
+            # Sorting: a '-' prefix means descending. Only table fields are
+            # accepted; anything else falls back to id so paging stays stable.
+            sort_field = request.query_params.get('sort', sort_default)
+            descending = sort_field.startswith('-')  # type: ignore[union-attr]
+            sort_field_name = sort_field[1:] if descending else sort_field  # type: ignore[index]
+            if sort_field_name in table_fields:
+                orderby = table[sort_field_name]
+                if descending:
+                    orderby = ~orderby
             else:
-                # Ascending
-                if hasattr(self.model, sort_field):  # type: ignore[arg-type]
-                    query = query.select(orderby=getattr(self.model, sort_field))  # type: ignore[arg-type]
-            
-            # Count total
-            total_count = query.count()
+                orderby = table.id
             
             # Paginate
             offset = (page - 1) * per_page
-            records = query.select(limitby=(offset, per_page))
+            records = query.select(
+                *select_fields, orderby=orderby, limitby=(offset, offset + per_page)
+            )
+            
+            # Count total. A short page (or a short first page) is the last
+            # one, so the total follows from it without a COUNT query.
+            page_count = len(records)
+            if page_count < per_page and (page_count or page == 1):
+                total_count = offset + page_count
+            else:
+                total_count = query.count()
             
             # Calculate pagination metadata
             total_pages = (total_count + per_page - 1) // per_page
             has_prev = page > 1
             has_next = page < total_pages
             
-            # Determine which columns to show
-            list_columns = self.config['list_columns']
-            if not list_columns:
-                # Show all fields except hidden ones
-                list_columns = [f for f in self._get_model_fields() 
-                               if not self._is_field_hidden(f)]
+            # Resolve every referenced record on the page up front
+            related = self._prefetch_relationships(records, list_columns)
+            
+            # Formatted cells for this render; bools, dates and references
+            # repeat a lot within a page
+            formatted = {}
+            
+            def format_field(field_name, value):
+                try:
+                    return formatted[field_name, value]
+                except KeyError:
+                    pass
+                except TypeError:
+                    # Unhashable value (e.g. list fields): format directly
+                    return self._format_field_value(field_name, value)
+                lookup = related.get(field_name)
+                if lookup is not None and value in lookup:
+                    result = lookup[value]
+                else:
+                    result = self._format_field_value(field_name, value)
+                formatted[field_name, value] = result
+                return result
+            
+            perms = self._check_permissions_batch(('create', 'read', 'update', 'delete'))
             
             return self.app.template(
-                self._get_template('list.html'),
+                list_template,
                 records=records,
-                model_name=self.config['display_name'],
+                model_name=display_name,
                 model_name_plural=self.config['display_name_plural'],
                 columns=list_columns,
                 page=page,
@@ -307,321 +485,311 @@ class AutoUIGenerator:
                 sort_field=sort_field,
                 url_prefix=self.url_prefix,
                 model_name_lower=self.model_name,
-                format_field=self._format_field_value,
-                can_create=self._check_permission('create'),
-                can_read=self._check_permission('read'),
-                can_update=self._check_permission('update'),
-                can_delete=self._check_permission('delete')
+                detail_url=self._record_url_format(names['detail']).format,
+                edit_url=self._record_url_format(names['edit']).format,
+                delete_url=self._record_url_format(names['delete_confirm']).format,
+                format_field=format_field,
+                can_create=perms['create'],
+                can_read=perms['read'],
+                can_update=perms['update'],
+                can_delete=perms['delete']
             )
         
         return list_view
     
     def _register_create_routes(self):
         """Create and register create form and action routes."""
-        @self.app.route(f"{self.url_prefix}/new", name=f"{self.model_name}_new")
-        async def create_form():
-            if not self._check_permission('create'):
-                if session.auth:
-                    abort(403)
-                redirect(url('auth/login'))
-            
-            form = Form(self.model)
-            
+        names = self._route_names
+        form_template = self._get_template('form.html')
+        display_name = self.config['display_name']
+        
+        def render_form(form):
             return self.app.template(
-                self._get_template('form.html'),
+                form_template,
                 form=form,
-                model_name=self.config['display_name'],
-                action_url=url(f"{self.model_name}_create"),
-                cancel_url=url(f"{self.model_name}_list"),
+                model_name=display_name,
+                action_url=url(names['create']),
+                cancel_url=url(names['list']),
                 is_edit=False
             )
         
-        @self.app.route(f"{self.url_prefix}/", methods=['post'], name=f"{self.model_name}_create")
+        @self.app.route(f"{self.url_prefix}/new", name=names['new'])
+        async def create_form():
+            self._enforce_permission('create')
+            return render_form(Form(self.model))
+        
+        @self.app.route(f"{self.url_prefix}/", methods=['post'], name=names['create'])
         async def create_action():
-            if not self._check_permission('create'):
-                if session.auth:
-                    abort(403)
-                redirect(url('auth/login'))
+            self._enforce_permission('create')
             
             form = Form(self.model)
             
             if form.accepted:
                 record = form.vars  # type: ignore[attr-defined]
-                redirect(url(f"{self.model_name}_detail", record.id))  # type: ignore[attr-defined]
+                redirect(url(names['detail'], record.id))  # type: ignore[attr-defined]
             
-            return self.app.template(
-                self._get_template('form.html'),
-                form=form,
-                model_name=self.config['display_name'],
-                action_url=url(f"{self.model_name}_create"),
-                cancel_url=url(f"{self.model_name}_list"),
-                is_edit=False
-            )
+            return render_form(form)
         
         return create_form, create_action
     
     def _register_detail_route(self):
         """Create and register detail view route."""
-        @self.app.route(f"{self.url_prefix}/<int:record_id>", name=f"{self.model_name}_detail")
+        names = self._route_names
+        detail_template = self._get_template('detail.html')
+        display_name = self.config['display_name']
+        not_found = f"{display_name} not found"
+        
+        # Readable fields with their labels, resolved once
+        field_config = self.config['field_config']
+        visible_fields = [
+            (field_name, field_config.get(field_name, {}).get(
+                'display_name', field_name.replace('_', ' ').title()
+            ))
+            for field_name in self._get_model_fields()
+            if not self._is_field_hidden(field_name)
+        ]
+        
+        @self.app.route(f"{self.url_prefix}/<int:record_id>", name=names['detail'])
         async def detail_view(record_id):
-            if not self._check_permission('read'):
-                if session.auth:
-                    abort(403)
-                redirect(url('auth/login'))
+            self._enforce_permission('read')
             
-            record = self.db(self.model.id == record_id).select().first()
-            if not record:
-                abort(404, f"{self.config['display_name']} not found")
+            record = self._get_record_or_404(record_id, not_found)
             
-            # Get all readable fields
-            fields = self._get_model_fields()
-            field_data = []
-            for field_name in fields:
-                if not self._is_field_hidden(field_name):
-                    field_config = self.config['field_config'].get(field_name, {})
-                    display_name = field_config.get('display_name', field_name.replace('_', ' ').title())
-                    value = getattr(record, field_name)
-                    formatted_value = self._format_field_value(field_name, value)
-                    field_data.append({
-                        'name': field_name,
-                        'display_name': display_name,
-                        'value': value,
-                        'formatted_value': formatted_value
-                    })
+            format_value = self._format_field_value
+            field_data = [
+                {
+                    'name': field_name,
+                    'display_name': label,
+                    'value': record[field_name],
+                    'formatted_value': format_value(field_name, record[field_name])
+                }
+                for field_name, label in visible_fields
+            ]
+            
+            perms = self._check_permissions_batch(('update', 'delete'))
             
             return self.app.template(
-                self._get_template('detail.html'),
+                detail_template,
                 record=record,
-                model_name=self.config['display_name'],
+                model_name=display_name,
                 field_data=field_data,
-                edit_url=url(f"{self.model_name}_edit", record_id),
-                delete_url=url(f"{self.model_name}_delete_confirm", record_id),
-                list_url=url(f"{self.model_name}_list"),
-                can_update=self._check_permission('update'),
-                can_delete=self._check_permission('delete')
+                edit_url=url(names['edit'], record_id),
+                delete_url=url(names['delete_confirm'], record_id),
+                list_url=url(names['list']),
+                can_update=perms['update'],
+                can_delete=perms['delete']
             )
         
         return detail_view
     
     def _register_update_routes(self):
         """Create and register update form and action routes."""
-        @self.app.route(f"{self.url_prefix}/<int:record_id>/edit", name=f"{self.model_name}_edit")
-        async def update_form(record_id):
-            if not self._check_permission('update'):
-                if session.auth:
-                    abort(403)
-                redirect(url('auth/login'))
-            
-            record = self.db(self.model.id == record_id).select().first()
-            if not record:
-                abort(404, f"{self.config['display_name']} not found")
-            
-            form = Form(self.model, record=record)
-            
+        names = self._route_names
+        form_template = self._get_template('form.html')
+        display_name = self.config['display_name']
+        not_found = f"{display_name} not found"
+        
+        def render_form(form, record_id):
             return self.app.template(
-                self._get_template('form.html'),
+                form_template,
                 form=form,
-                model_name=self.config['display_name'],
-                action_url=url(f"{self.model_name}_update", record_id),
-                cancel_url=url(f"{self.model_name}_detail", record_id),
+                model_name=display_name,
+                action_url=url(names['update'], record_id),
+                cancel_url=url(names['detail'], record_id),
                 is_edit=True
             )
         
-        @self.app.route(f"{self.url_prefix}/<int:record_id>", methods=['post'], name=f"{self.model_name}_update")
+        @self.app.route(f"{self.url_prefix}/<int:record_id>/edit", name=names['edit'])
+        async def update_form(record_id):
+            self._enforce_permission('update')
+            record = self._get_record_or_404(record_id, not_found)
+            return render_form(Form(self.model, record=record), record_id)
+        
+        @self.app.route(f"{self.url_prefix}/<int:record_id>", methods=['post'], name=names['update'])
         async def update_action(record_id):
-            if not self._check_permission('update'):
-                if session.auth:
-                    abort(403)
-                redirect(url('auth/login'))
-            
-            record = self.db(self.model.id == record_id).select().first()
-            if not record:
-                abort(404, f"{self.config['display_name']} not found")
+            self._enforce_permission('update')
+            record = self._get_record_or_404(record_id, not_found)
             
             form = Form(self.model, record=record)
             
             if form.accepted:
-                redirect(url(f"{self.model_name}_detail", record_id))
+                redirect(url(names['detail'], record_id))
             
-            return self.app.template(
-                self._get_template('form.html'),
-                form=form,
-                model_name=self.config['display_name'],
-                action_url=url(f"{self.model_name}_update", record_id),
-                cancel_url=url(f"{self.model_name}_detail", record_id),
-                is_edit=True
-            )
+            return render_form(form, record_id)
         
         return update_form, update_action
     
     def _register_delete_routes(self):
         """Create and register delete confirmation and action routes."""
-        @self.app.route(f"{self.url_prefix}/<int:record_id>/delete", name=f"{self.model_name}_delete_confirm")
+        names = self._route_names
+        delete_template = self._get_template('delete.html')
+        display_name = self.config['display_name']
+        not_found = f"{display_name} not found"
+        deleted_message = f"{display_name} deleted successfully"
+        
+        @self.app.route(f"{self.url_prefix}/<int:record_id>/delete", name=names['delete_confirm'])
         async def delete_confirm(record_id):
-            if not self._check_permission('delete'):
-                if session.auth:
-                    abort(403)
-                redirect(url('auth/login'))
+            self._enforce_permission('delete')
             
-            record = self.db(self.model.id == record_id).select().first()
-            if not record:
-                abort(404, f"{self.config['display_name']} not found")
+            record = self._get_record_or_404(record_id, not_found)
             
             return self.app.template(
-                self._get_template('delete.html'),
+                delete_template,
                 record=record,
-                model_name=self.config['display_name'],
-                delete_url=url(f"{self.model_name}_delete_action", record_id),
-                cancel_url=url(f"{self.model_name}_detail", record_id)
+                model_name=display_name,
+                delete_url=url(names['delete_action'], record_id),
+                cancel_url=url(names['detail'], record_id)
             )
         
-        @self.app.route(f"{self.url_prefix}/<int:record_id>/delete", methods=['post'], name=f"{self.model_name}_delete_action")
+        @self.app.route(f"{self.url_prefix}/<int:record_id>/delete", methods=['post'], name=names['delete_action'])
         async def delete_action(record_id):
-            if not self._check_permission('delete'):
-                if session.auth:
-                    abort(403)
-                redirect(url('auth/login'))
+            self._enforce_permission('delete')
             
-            record = self.db(self.model.id == record_id).select().first()
-            if not record:
-                abort(404, f"{self.config['display_name']} not found")
-            
-            record.delete_record()
+            # Delete by id directly; the row count tells us if it existed
+            if not self.db(self.model.id == record_id).delete():
+                abort(404, not_found)
             
             # Store success message in session if available
             if hasattr(session, 'flash'):
-                session.flash = f"{self.config['display_name']} deleted successfully"
+                session.flash = deleted_message
             
-            redirect(url(f"{self.model_name}_list"))
+            redirect(url(names['list']))
         
         return delete_confirm, delete_action
     
     def _get_model_fields(self):
         """Extract field names from model."""
-        fields = []
-        for key, value in self.model.__dict__.items():
-            if isinstance(value, Field):
-                fields.append(key)
-        return fields
+        return list(self._fields)
     
     def _get_field_type(self, field_name):
         """Determine field type for UI mapping."""
-        if not hasattr(self.model, field_name):
-            return 'string'
-        
-        field = getattr(self.model, field_name)
-        if not isinstance(field, Field):
-            return 'string'
-        
-        # Check field type
-        field_type = field._type
-        
-        # Map pyDAL types to UI mapping types
-        # Note: Emmett/pyDAL already uses short names (bool, int, etc.)
-        # but we include both long and short forms for compatibility
-        type_mapping = {
-            'string': 'string',
-            'text': 'text',
-            'blob': 'text',
-            'bool': 'bool',
-            'boolean': 'bool',
-            'int': 'int',
-            'integer': 'int',
-            'bigint': 'int',
-            'float': 'float',
-            'double': 'float',
-            'decimal': 'float',
-            'date': 'date',
-            'time': 'time',
-            'datetime': 'datetime',
-            'password': 'password',
-            'upload': 'file',
-            'reference': 'belongs_to',
-        }
-        
-        return type_mapping.get(field_type, 'string')
+        return self._field_types.get(field_name, 'string')
+    
+    def _resolve_formatter(self, field_type):
+        """Return the bound formatter method for a UI field type, if any."""
+        formatter_name = self.ui_mapping.get_formatter_for_type(field_type)
+        if formatter_name:
+            return getattr(self, formatter_name, None)
+        return None
     
     def _is_field_hidden(self, field_name):
         """Check if field should be hidden."""
-        field_config = self.config['field_config'].get(field_name, {})
-        if field_config.get('hidden', False):
-            return True
-        
+        return field_name in self._hidden_fields
+    
+    def _get_hidden_fields(self):
+        """Collect field names hidden by field_config or the model's fields_rw."""
+        hidden = {
+            name for name, field_config in self.config['field_config'].items()
+            if field_config.get('hidden', False)
+        }
         # Check model's fields_rw configuration
-        if hasattr(self.model, 'fields_rw'):
-            rw_config = self.model.fields_rw.get(field_name)
-            if rw_config is False:
-                return True
-        
-        return False
+        fields_rw = getattr(self.model, 'fields_rw', None) or {}
+        hidden.update(name for name, rw_config in fields_rw.items() if rw_config is False)
+        return frozenset(hidden)
     
     def _format_field_value(self, field_name, value):
         """Format field value for display using formatters."""
         if value is None:
             return '-'
         
-        field_type = self._get_field_type(field_name)
-        formatter_name = self.ui_mapping.get_formatter_for_type(field_type)
-        
-        if formatter_name and hasattr(self, formatter_name):
-            return getattr(self, formatter_name)(value, field_name)
+        formatter = self._formatters.get(field_name, self._default_formatter)
+        if formatter is not None:
+            return formatter(value, field_name)
         
         return str(value)
     
     def format_datetime(self, value, field_name=None):
         """Format datetime objects."""
         if isinstance(value, datetime):
-            return value.strftime('%b %d, %Y %I:%M %p')
+            return value.strftime(_DATETIME_FORMAT)
         return str(value)
     
     def format_date(self, value, field_name=None):
         """Format date objects."""
         if isinstance(value, date):
-            return value.strftime('%b %d, %Y')
+            return value.strftime(_DATE_FORMAT)
         return str(value)
     
     def format_time(self, value, field_name=None):
         """Format time objects."""
         if isinstance(value, time):
-            return value.strftime('%I:%M %p')
+            return value.strftime(_TIME_FORMAT)
         return str(value)
     
     def format_boolean(self, value, field_name=None):
         """Format boolean values."""
-        if value is True:
-            return '✓ Yes'
-        elif value is False:
-            return '✗ No'
+        # Exact type check: 1/0 must not render as Yes/No
+        if value.__class__ is bool:
+            return _BOOLEAN_LABELS[value]
         return str(value)
     
     def format_relationship(self, value, field_name=None):
         """Format relationship fields."""
         # For belongs_to relationships, pyDAL stores the ID
         # We need to fetch the related record to display it properly
-        if isinstance(value, int) and field_name:
-            # Try to find the related model
-            for attr_name in dir(self.model):
-                if attr_name.startswith('_'):
-                    continue
-                attr = getattr(self.model, attr_name)
-                if hasattr(attr, 'reference') and attr.reference:
-                    # This is a reference field
-                    ref_model = attr.reference
-                    try:
-                        related_record = self.db(ref_model.id == value).select().first()
-                        if related_record:
-                            # Try common display fields
-                            for display_field in ['name', 'title', 'email', 'username']:
-                                if hasattr(related_record, display_field):
-                                    return getattr(related_record, display_field)
-                            return f"{ref_model.__name__} #{value}"
-                    except:
-                        pass
+        ref_table = self._ref_fields.get(field_name) if field_name else None
+        if ref_table is not None and isinstance(value, int):
+            try:
+                lookup = self._fetch_display_values(ref_table, {value})
+            except Exception:
+                lookup = {}
+            if value in lookup:
+                return lookup[value]
         
         return str(value)
     
+    def _get_reference_fields(self):
+        """Map reference field names to the tables they point at."""
+        ref_fields = {}
+        table = getattr(self.model, 'table', None)
+        if table is None:
+            return ref_fields
+        for field in table:
+            if field.type.startswith('reference '):
+                ref_fields[field.name] = self.db[field.type.split(' ', 1)[1]]
+        return ref_fields
+    
+    def _fetch_display_values(self, ref_table, ids):
+        """Fetch display values for a set of referenced ids in one query."""
+        # Try common display fields
+        display_field = next(
+            (name for name in ('name', 'title', 'email', 'username') if name in ref_table.fields),
+            None
+        )
+        if display_field is None:
+            ref_model = getattr(ref_table, '_model_', None)
+            label = ref_model.__name__ if ref_model else ref_table._tablename
+            rows = self.db(ref_table.id.belongs(ids)).select(ref_table.id)
+            return {row.id: f"{label} #{row.id}" for row in rows}
+        rows = self.db(ref_table.id.belongs(ids)).select(ref_table.id, ref_table[display_field])
+        return {row.id: row[display_field] for row in rows}
+    
+    def _prefetch_relationships(self, records, columns):
+        """
+        Batch-load display values for the reference columns on a page.
+        
+        Returns {field_name: {id: display_value}}, built with one query per
+        reference column instead of one per row.
+        """
+        related = {}
+        for field_name in columns:
+            ref_table = self._ref_fields.get(field_name)
+            if ref_table is None:
+                continue
+            ids = {record[field_name] for record in records if record[field_name]}
+            if ids:
+                related[field_name] = self._fetch_display_values(ref_table, ids)
+        return related
+    
     def _get_template(self, template_name):
         """Get template path with override support."""
+        template = self._template_paths.get(template_name)
+        if template is None:
+            template = self._template_paths[template_name] = self._resolve_template(template_name)
+        return template
+    
+    def _resolve_template(self, template_name):
+        """Pick the model's custom template if one exists, else the default."""
         # Check for custom template first
         custom_template = f'auto_ui_custom/{self.model_name}/{template_name}'
         custom_path = os.path.join(self.app.template_folder, custom_template)
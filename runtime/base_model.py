@@ -14,10 +14,91 @@ A "fat model" base class that includes:
 All features have sensible defaults that can be overridden with decorators.
 """
 
-from functools import wraps
-from typing import Any, Dict, Optional, Callable
+import asyncio
+import atexit
+import inspect
+import logging
+import queue
+import sys
+import time
+from threading import Lock, Thread
+from typing import Any, Dict, List, Optional, Callable
 from emmett.orm import Model
-from emmett import request, redirect, url, abort, current, session  # type: ignore[reportUnusedImport]
+from emmett import request, response, redirect, url, abort, current, session  # type: ignore[reportUnusedImport]
+
+try:
+    # orjson encodes JSON bodies several times faster than stdlib json
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
+try:
+    # Preferred outbound client: pooled keep-alive, sync and async
+    import httpx
+except ImportError:
+    httpx = None  # type: ignore[assignment]
+
+try:
+    import requests
+except ImportError:
+    requests = None  # type: ignore[assignment]
+
+# Outbound API calls: timeout in seconds, and the keyword each supported
+# method sends its data as (None: no payload)
+_API_TIMEOUT = 10
+_API_DATA_ARGS = {'GET': 'params', 'POST': 'json', 'PUT': 'json', 'DELETE': None}
+
+if orjson is not None:
+    def _json_dumps(obj: Any) -> bytes:
+        """Encode obj as JSON bytes with orjson."""
+        return orjson.dumps(obj, default=str)
+else:
+    import json
+    
+    def _json_dumps(obj: Any) -> bytes:
+        """Encode obj as JSON bytes with stdlib json."""
+        return json.dumps(obj, default=str).encode('utf-8')
+
+logger = logging.getLogger(__name__)
+
+
+_REGISTRY_NAMES = (
+    '_http_handlers', '_response_formatters', '_template_renderers',
+    '_api_clients', '_email_handlers', '_session_handlers', '_route_handlers'
+)
+
+# Default implementations by operation / format, resolved per class and
+# seeded into its registries so subclasses overriding them are honoured
+_OP_METHODS = {
+    'create': '_default_create_handler',
+    'read': '_default_read_handler',
+    'update': '_default_update_handler',
+    'delete': '_default_delete_handler',
+}
+_FORMAT_METHODS = {
+    'json': '_default_json_formatter',
+    'xml': '_default_xml_formatter',
+    'html': '_default_html_formatter',
+}
+
+# Attributes the override decorators attach their registration function as
+_REGISTER_ATTRS = (
+    '_register_handler', '_register_formatter', '_register_renderer',
+    '_register_api', '_register_email', '_register_session', '_register_route'
+)
+
+# Route name suffix and whether the route takes the record id, by action
+_ROUTE_SUFFIXES = {
+    'show': ('_detail', True),
+    'edit': ('_edit', True),
+    'delete': ('_delete', True),
+    'list': ('_list', False),
+}
+
+
+def _session_available() -> bool:
+    """Whether a session is bound to the current request context."""
+    return getattr(current, 'session', None) is not None
 
 
 class BaseModel(Model):
@@ -40,15 +121,85 @@ class BaseModel(Model):
                 return {'custom': data}
     """
     
-    # Class-level registries for overrides
+    # Override registries; every subclass gets its own (see __init_subclass__)
     _http_handlers: Dict[str, Callable] = {}
     _response_formatters: Dict[str, Callable] = {}
     _template_renderers: Dict[str, Callable] = {}
     _api_clients: Dict[str, Callable] = {}
     _email_handlers: Dict[str, Callable] = {}
-    _session_handlers: Dict[str, Callable] = {}
+    _session_handlers: Dict[tuple, Callable] = {}
     _route_handlers: Dict[str, Callable] = {}
     
+    # Per-class (route name, takes record id) by action, see _build_dispatch_tables
+    _ROUTE_TABLE: Dict[str, tuple] = {}
+    
+    # Process-wide outbound HTTP clients, created on first use
+    _http_client: Any = None
+    _ahttp_client: Any = None
+    
+    # Per-class to_dict field names, filled lazily by _get_serializable_fields
+    __to_dict_fields__: Optional[tuple] = None
+    
+    # Interned class name and its lowercase form, set per class
+    _name: str = 'BaseModel'
+    _name_lower: str = 'basemodel'
+    
+    # Direct subclasses with auto_routes (anything but False), in definition
+    # order; grandchildren are not discovered, as with __subclasses__()
+    _auto_routes_registry: List[type] = []
+    
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._name = sys.intern(cls.__name__)
+        cls._name_lower = sys.intern(cls.__name__.lower())
+        for name in _REGISTRY_NAMES:
+            setattr(cls, name, {})
+        cls._build_dispatch_tables()
+        cls._register_overrides()
+        if BaseModel in cls.__bases__ and getattr(cls, 'auto_routes', False) is not False:
+            BaseModel._auto_routes_registry.append(cls)
+    
+    @classmethod
+    def _build_dispatch_tables(cls):
+        """
+        Seed cls's operation and format registries with its defaults, and
+        build its route names.
+        
+        Overrides registered afterwards replace the seeded entries, so
+        dispatch is a single registry lookup.
+        """
+        cls._http_handlers.update(
+            (op, getattr(cls, name)) for op, name in _OP_METHODS.items()
+        )
+        cls._response_formatters.update(
+            (fmt, getattr(cls, name)) for fmt, name in _FORMAT_METHODS.items()
+        )
+        cls._ROUTE_TABLE = {
+            action: (cls._name_lower + suffix, with_id)
+            for action, (suffix, with_id) in _ROUTE_SUFFIXES.items()
+        }
+    
+    @classmethod
+    def _register_overrides(cls):
+        """
+        Register the methods marked by the override decorators on cls.
+        
+        Inherited overrides are included unless a subclass redefines the
+        method under the same name; the most derived definition wins.
+        """
+        methods: Dict[str, Any] = {}
+        for klass in reversed(cls.__mro__):
+            if issubclass(klass, BaseModel):
+                methods.update(vars(klass))
+        for value in methods.values():
+            if not inspect.isfunction(value):
+                continue
+            for attr in _REGISTER_ATTRS:
+                register = getattr(value, attr, None)
+                if register is not None:
+                    register(cls)
+                    break
+    
     # ========================================================================
     # HTTP REQUEST HANDLING (Base Implementation + Override Decorator)
     # ========================================================================
@@ -67,22 +218,11 @@ class BaseModel(Model):
         if req is None:
             req = request
         
-        # Check for override
-        handler_key = f"{self.__class__.__name__}:{operation}"
-        if handler_key in self._http_handlers:
-            return self._http_handlers[handler_key](self, req)
-        
-        # Default implementation
-        if operation == 'create':
-            return self._default_create_handler(req)
-        elif operation == 'read':
-            return self._default_read_handler(req)
-        elif operation == 'update':
-            return self._default_update_handler(req)
-        elif operation == 'delete':
-            return self._default_delete_handler(req)
-        else:
+        # Override or default implementation
+        handler = self._http_handlers.get(operation)
+        if handler is None:
             abort(400, f"Unknown operation: {operation}")
+        return handler(self, req)
     
     def _default_create_handler(self, req):
         """Default handler for create operations."""
@@ -112,31 +252,27 @@ class BaseModel(Model):
     # RESPONSE FORMATTING (Base Implementation + Override Decorator)
     # ========================================================================
     
-    def format_response(self, data: Any, format_type: str = 'json') -> Any:
+    def format_response(self, data: Any, format_type: str = 'json', as_bytes: bool = False) -> Any:
         """
         Base response formatter.
         
         Args:
             data: Data to format
             format_type: Format type ('json', 'xml', 'html')
+            as_bytes: For 'json', return the encoded body instead of a dict
+                (must be called while handling a request)
             
         Returns:
             Formatted response
         """
-        # Check for override
-        formatter_key = f"{self.__class__.__name__}:{format_type}"
-        if formatter_key in self._response_formatters:
-            return self._response_formatters[formatter_key](self, data)
+        if as_bytes and format_type == 'json':
+            return self._default_json_bytes_formatter(self.format_response(data, format_type))
         
-        # Default implementation
-        if format_type == 'json':
-            return self._default_json_formatter(data)
-        elif format_type == 'xml':
-            return self._default_xml_formatter(data)
-        elif format_type == 'html':
-            return self._default_html_formatter(data)
-        else:
+        # Override or default implementation
+        formatter = self._response_formatters.get(format_type)
+        if formatter is None:
             return data
+        return formatter(self, data)
     
     def _default_json_formatter(self, data):
         """Default JSON formatter."""
@@ -144,33 +280,46 @@ class BaseModel(Model):
             return data
         return self.to_dict()
     
+    def _default_json_bytes_formatter(self, data):
+        """Encode formatted JSON data as a ready-to-write response body."""
+        response.headers['content-type'] = 'application/json'
+        return _json_dumps(data)
+    
     def _default_xml_formatter(self, data):
         """Default XML formatter."""
-        # Simple XML conversion
-        xml = ['<?xml version="1.0"?>']
-        xml.append(f'<{self.__class__.__name__.lower()}>')
-        for key, value in self.to_dict().items():
-            xml.append(f'  <{key}>{value}</{key}>')
-        xml.append(f'</{self.__class__.__name__.lower()}>')
-        return '\n'.join(xml)
+        # Simple XML conversion; elements follow to_dict(), so subclasses
+        # that drop or add keys there are reflected as-is
+        root = self._name_lower
+        return ''.join([
+            f'<?xml version="1.0"?>\n<{root}>\n',
+            *[f'  <{key}>{value}</{key}>\n' for key, value in self.to_dict().items()],
+            f'</{root}>'
+        ])
     
     def _default_html_formatter(self, data):
         """Default HTML formatter."""
         return f"<div class='model'>{self.to_dict()}</div>"
     
+    @classmethod
+    def _get_serializable_fields(cls) -> tuple:
+        """
+        Field names serialized by to_dict, computed once per class.
+        
+        Read from the ORM table, so the cache is only filled once the
+        model has been defined on a database.
+        """
+        fields = cls.__dict__.get('__to_dict_fields__')
+        if fields is None:
+            table = getattr(cls, 'table', None)
+            if table is None:
+                return ()
+            fields = tuple(table.fields)
+            cls.__to_dict_fields__ = fields
+        return fields
+    
     def to_dict(self) -> Dict[str, Any]:
         """Convert model instance to dictionary."""
-        result = {}
-        for key in dir(self):
-            if key.startswith('_') or callable(getattr(self, key)):
-                continue
-            try:
-                value = getattr(self, key)
-                if not callable(value):
-                    result[key] = value
-            except:
-                pass
-        return result
+        return {key: getattr(self, key) for key in type(self)._get_serializable_fields()}
     
     # ========================================================================
     # TEMPLATE RENDERING (Base Implementation + Override Decorator)
@@ -188,26 +337,25 @@ class BaseModel(Model):
             Rendered template
         """
         if template_name is None:
-            template_name = f"{self.__class__.__name__.lower()}.html"
+            template_name = f"{self._name_lower}.html"
         
         # Check for override
-        renderer_key = f"{self.__class__.__name__}:{template_name}"
-        if renderer_key in self._template_renderers:
-            return self._template_renderers[renderer_key](self, **context)
+        renderer = self._template_renderers.get(template_name)
+        if renderer is not None:
+            return renderer(self, **context)
         
         # Default implementation
         return self._default_template_renderer(template_name, **context)
     
     def _default_template_renderer(self, template_name, **context):
         """Default template renderer."""
-        from emmett import current
         context['record'] = self
-        context['model_name'] = self.__class__.__name__
+        context['model_name'] = self._name
         try:
             return current.app.template(template_name, **context)
         except:
             # Fallback if no app context
-            return f"<div>Model: {self.__class__.__name__}, Template: {template_name}</div>"
+            return f"<div>Model: {self._name}, Template: {template_name}</div>"
     
     # ========================================================================
     # EXTERNAL API CALLS (Base Implementation + Override Decorator)
@@ -226,32 +374,127 @@ class BaseModel(Model):
             API response
         """
         # Check for override
-        api_key = f"{self.__class__.__name__}:{endpoint}"
-        if api_key in self._api_clients:
-            return self._api_clients[api_key](self, method, data)
+        client = self._api_clients.get(endpoint)
+        if client is not None:
+            return client(self, method, data)
         
         # Default implementation
         return self._default_api_caller(endpoint, method, data)
     
+    async def call_api_async(self, endpoint: str, method: str = 'GET', data: Optional[Dict] = None):
+        """
+        Async variant of call_api, for use from async routes.
+        
+        Overrides may be plain functions or coroutines. Without httpx the
+        default falls back to the sync caller in a worker thread.
+        """
+        # Check for override
+        client = self._api_clients.get(endpoint)
+        if client is not None:
+            result = client(self, method, data)
+            if inspect.isawaitable(result):
+                result = await result
+            return result
+        
+        # Default implementation
+        return await self._default_api_caller_async(endpoint, method, data)
+    
+    async def call_apis(self, calls: List[tuple], max_concurrency: int = 10) -> List[Any]:
+        """
+        Run several API calls concurrently.
+        
+        Args:
+            calls: (endpoint, method, data) tuples
+            max_concurrency: Maximum number of calls in flight at once
+        
+        Returns:
+            Results in the order of calls; a call that raised yields its exception
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+        
+        async def run(endpoint, method, data):
+            async with semaphore:
+                return await self.call_api_async(endpoint, method, data)
+        
+        return await asyncio.gather(
+            *(run(endpoint, method, data) for endpoint, method, data in calls),
+            return_exceptions=True
+        )
+
+    @staticmethod
+    def _get_http_client() -> Any:
+        """
+        Get the shared sync HTTP client.
+        
+        Returns:
+            httpx.Client, a requests.Session if httpx is not installed,
+            or None if neither is available
+        """
+        if BaseModel._http_client is None:
+            if httpx is not None:
+                BaseModel._http_client = httpx.Client(
+                    timeout=_API_TIMEOUT,
+                    limits=httpx.Limits(max_keepalive_connections=100),
+                    # requests.get followed redirects; keep that behaviour
+                    follow_redirects=True
+                )
+            elif requests is not None:
+                BaseModel._http_client = requests.Session()
+        return BaseModel._http_client
+    
+    @staticmethod
+    def _get_async_http_client() -> Any:
+        """
+        Get the shared async HTTP client.
+        
+        Returns:
+            httpx.AsyncClient, or None if httpx is not installed
+        """
+        if httpx is None:
+            return None
+        if BaseModel._ahttp_client is None:
+            BaseModel._ahttp_client = httpx.AsyncClient(
+                timeout=_API_TIMEOUT,
+                limits=httpx.Limits(max_keepalive_connections=100),
+                follow_redirects=True
+            )
+        return BaseModel._ahttp_client
+    
+    @staticmethod
+    def _api_request_kwargs(method, data) -> Dict[str, Any]:
+        """Keyword arguments carrying data for a supported method."""
+        data_arg = _API_DATA_ARGS.get(method, False)
+        if data_arg is False:
+            raise ValueError(f"Unsupported method: {method}")
+        kwargs: Dict[str, Any] = {'timeout': _API_TIMEOUT}
+        if data_arg is not None:
+            kwargs[data_arg] = data
+        return kwargs
+    
+    @staticmethod
+    def _decode_api_response(resp):
+        """Decode JSON responses, return the text body otherwise."""
+        return resp.json() if resp.headers.get('content-type') == 'application/json' else resp.text
+    
     def _default_api_caller(self, endpoint, method, data):
         """Default API caller."""
+        client = self._get_http_client()
+        if client is None:
+            return {'error': 'httpx or requests library not installed'}
         try:
-            import requests
-            
-            if method == 'GET':
-                resp = requests.get(endpoint, params=data)
-            elif method == 'POST':
-                resp = requests.post(endpoint, json=data)
-            elif method == 'PUT':
-                resp = requests.put(endpoint, json=data)
-            elif method == 'DELETE':
-                resp = requests.delete(endpoint)
-            else:
-                raise ValueError(f"Unsupported method: {method}")
-            
-            return resp.json() if resp.headers.get('content-type') == 'application/json' else resp.text
-        except ImportError:
-            return {'error': 'requests library not installed'}
+            resp = client.request(method, endpoint, **self._api_request_kwargs(method, data))
+            return self._decode_api_response(resp)
+        except Exception as e:
+            return {'error': str(e)}
+    
+    async def _default_api_caller_async(self, endpoint, method, data):
+        """Default async API caller."""
+        client = self._get_async_http_client()
+        if client is None:
+            return await asyncio.to_thread(self._default_api_caller, endpoint, method, data)
+        try:
+            resp = await client.request(method, endpoint, **self._api_request_kwargs(method, data))
+            return self._decode_api_response(resp)
         except Exception as e:
             return {'error': str(e)}
     
@@ -270,30 +513,42 @@ class BaseModel(Model):
             email_type: Type of email (for overrides)
             
         Returns:
-            Success status
+            An override's return value for email_type if one is registered.
+            Otherwise the default sender returns one of:
+
+            - {'queued': True, 'message': 'Email queued'}: handed to the
+              background worker. This is not a delivery confirmation; send
+              failures are only logged, and queued mail is flushed for up
+              to _EMAIL_FLUSH_TIMEOUT seconds at interpreter exit.
+            - {'success': True, 'message': 'Email sent'}: the queue was full
+              (_EMAIL_QUEUE_SIZE messages) so the message was sent
+              synchronously.
+            - {'success': False, 'error': ...}: no mailer is configured or
+              the synchronous send raised.
         """
         # Check for override
-        email_key = f"{self.__class__.__name__}:{email_type}"
-        if email_key in self._email_handlers:
-            return self._email_handlers[email_key](self, to, subject, body)
+        handler = self._email_handlers.get(email_type)
+        if handler is not None:
+            return handler(self, to, subject, body)
         
         # Default implementation
         return self._default_email_sender(to, subject, body)
     
     def _default_email_sender(self, to, subject, body):
-        """Default email sender."""
+        """
+        Default email sender.
+        
+        Hands the message to a background worker instead of waiting on the
+        SMTP round-trip and returns {'queued': True}; delivery failures are
+        only logged by the worker. When the queue is full the message is
+        sent synchronously instead and the send result is returned.
+        """
         try:
-            from emmett import current
             mailer = current.app.ext.Mailer
-            
-            mailer.send(
-                to=to,
-                subject=subject,
-                body=body
-            )
-            return {'success': True, 'message': 'Email sent'}
         except Exception as e:
             return {'success': False, 'error': str(e)}
+        _start_email_worker()
+        return _queue_email(_email_queue, mailer, {'to': to, 'subject': subject, 'body': body})
     
     # ========================================================================
     # SESSION MANAGEMENT (Base Implementation + Override Decorator)
@@ -311,9 +566,9 @@ class BaseModel(Model):
             Session value
         """
         # Check for override
-        session_key = f"{self.__class__.__name__}:get:{key}"
-        if session_key in self._session_handlers:
-            return self._session_handlers[session_key](self, key, default)
+        handler = self._session_handlers.get(('get', key))
+        if handler is not None:
+            return handler(self, key, default)
         
         # Default implementation
         return self._default_get_session(key, default)
@@ -327,27 +582,25 @@ class BaseModel(Model):
             value: Value to set
         """
         # Check for override
-        session_key = f"{self.__class__.__name__}:set:{key}"
-        if session_key in self._session_handlers:
-            return self._session_handlers[session_key](self, key, value)
+        handler = self._session_handlers.get(('set', key))
+        if handler is not None:
+            return handler(self, key, value)
         
         # Default implementation
         return self._default_set_session(key, value)
     
     def _default_get_session(self, key, default):
         """Default session getter."""
-        try:
-            return session.get(key, default)
-        except:
+        if not _session_available():
             return default
+        return session.get(key, default)
     
     def _default_set_session(self, key, value):
         """Default session setter."""
-        try:
-            session[key] = value
-            return True
-        except:
+        if not _session_available():
             return False
+        session[key] = value
+        return True
     
     # ========================================================================
     # ROUTING LOGIC (Base Implementation + Override Decorator)
@@ -365,27 +618,22 @@ class BaseModel(Model):
             Generated URL
         """
         # Check for override
-        route_key = f"{self.__class__.__name__}:{action}"
-        if route_key in self._route_handlers:
-            return self._route_handlers[route_key](self, **params)
+        handler = self._route_handlers.get(action)
+        if handler is not None:
+            return handler(self, **params)
         
         # Default implementation
         return self._default_route_generator(action, **params)
     
     def _default_route_generator(self, action, **params):
         """Default route generator."""
-        model_name = self.__class__.__name__.lower()
-        
-        if action == 'show':
-            return url(f'{model_name}_detail', self.id)  # type: ignore[attr-defined]
-        elif action == 'edit':
-            return url(f'{model_name}_edit', self.id)  # type: ignore[attr-defined]
-        elif action == 'delete':
-            return url(f'{model_name}_delete', self.id)  # type: ignore[attr-defined]
-        elif action == 'list':
-            return url(f'{model_name}_list')
-        else:
-            return url(f'{model_name}_{action}', self.id, **params)  # type: ignore[attr-defined]
+        route = self._ROUTE_TABLE.get(action)
+        if route is None:
+            return url(f'{self._name_lower}_{action}', self.id, **params)  # type: ignore[attr-defined]
+        route_name, with_id = route
+        if with_id:
+            return url(route_name, self.id)  # type: ignore[attr-defined]
+        return url(route_name)
     
     def redirect_to(self, action: str = 'show', **params):
         """
@@ -399,10 +647,111 @@ class BaseModel(Model):
         return redirect(route_url)
 
 
+BaseModel._build_dispatch_tables()
+
+
+# ============================================================================
+# BACKGROUND EMAIL DELIVERY
+# ============================================================================
+
+# (mailer, send kwargs) pairs waiting for delivery; bounded so a stalled
+# mail server can't grow it without limit
+_EMAIL_QUEUE_SIZE = 1000
+# Seconds to keep delivering queued mail at interpreter shutdown
+_EMAIL_FLUSH_TIMEOUT = 30
+_email_queue: 'queue.Queue[tuple]' = queue.Queue(maxsize=_EMAIL_QUEUE_SIZE)
+_email_worker: Optional[Thread] = None
+_email_worker_lock = Lock()
+
+
+def _deliver_emails(email_queue: 'queue.Queue[tuple]'):
+    """Send emails from email_queue one at a time, forever."""
+    while True:
+        mailer, message = email_queue.get()
+        try:
+            mailer.send(**message)
+        except Exception:
+            logger.exception("Failed to send email to %s", message.get('to'))
+        finally:
+            email_queue.task_done()
+
+
+def _queue_email(email_queue: 'queue.Queue[tuple]', mailer: Any, message: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Hand message to the worker serving email_queue, or send it now if the
+    queue is full. Returns the send_email status dict.
+    """
+    try:
+        email_queue.put_nowait((mailer, message))
+        return {'queued': True, 'message': 'Email queued'}
+    except queue.Full:
+        pass
+    try:
+        mailer.send(**message)
+    except Exception as e:
+        return {'success': False, 'error': str(e)}
+    return {'success': True, 'message': 'Email sent'}
+
+
+def _flush_emails(email_queue: 'Optional[queue.Queue[tuple]]' = None,
+                  timeout: float = _EMAIL_FLUSH_TIMEOUT) -> None:
+    """Wait (up to timeout seconds) for queued emails to be delivered."""
+    if email_queue is None:
+        email_queue = _email_queue
+    deadline = time.monotonic() + timeout
+    with email_queue.all_tasks_done:
+        while email_queue.unfinished_tasks:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                logger.warning(
+                    "Exiting with %d queued emails undelivered",
+                    email_queue.unfinished_tasks
+                )
+                return
+            email_queue.all_tasks_done.wait(remaining)
+
+
+def _start_email_worker():
+    """Start the email delivery thread on first use."""
+    global _email_worker
+    if _email_worker is not None:
+        return
+    with _email_worker_lock:
+        if _email_worker is None:
+            _email_worker = Thread(
+                target=_deliver_emails, args=(_email_queue,),
+                name='basemodel-email', daemon=True
+            )
+            _email_worker.start()
+            # The worker is a daemon thread; drain the queue before exit
+            atexit.register(_flush_emails)
+
+
 # ============================================================================
 # DECORATORS FOR OVERRIDING DEFAULTS
 # ============================================================================
 
+def _override_decorator(registry_name: str, key: Any, register_attr: str):
+    """
+    Build a decorator marking a method as the override stored under key
+    in the class registry named registry_name.
+    
+    The registration function is attached to the method as register_attr.
+    Key strings are interned, so lookups with literal names usually match
+    on identity.
+    """
+    key = tuple(map(sys.intern, key)) if isinstance(key, tuple) else sys.intern(key)
+    
+    def decorator(func):
+        def register_on_class(cls):
+            getattr(cls, registry_name)[key] = func
+            return func
+        
+        setattr(func, register_attr, register_on_class)
+        return func
+    return decorator
+
+
 def http_handler(operation: str):
     """
     Decorator to override default HTTP handler.
@@ -414,21 +763,7 @@ def http_handler(operation: str):
                 # Custom logic
                 pass
     """
-    def decorator(func):
-        @wraps(func)
-        def wrapper(self, req):
-            return func(self, req)
-        
-        # Register override
-        def register_on_class(cls):
-            handler_key = f"{cls.__name__}:{operation}"
-            cls._http_handlers[handler_key] = func
-            return wrapper
-        
-        # Store registration function on the wrapper
-        wrapper._register_handler = register_on_class  # type: ignore[attr-defined]
-        return wrapper
-    return decorator
+    return _override_decorator('_http_handlers', operation, '_register_handler')
 
 
 def response_formatter(format_type: str):
@@ -441,19 +776,7 @@ def response_formatter(format_type: str):
             def custom_json(self, data):
                 return {'custom': data}
     """
-    def decorator(func):
-        @wraps(func)
-        def wrapper(self, data):
-            return func(self, data)
-        
-        def register_on_class(cls):
-            formatter_key = f"{cls.__name__}:{format_type}"
-            cls._response_formatters[formatter_key] = func
-            return wrapper
-        
-        wrapper._register_formatter = register_on_class  # type: ignore[attr-defined]
-        return wrapper
-    return decorator
+    return _override_decorator('_response_formatters', format_type, '_register_formatter')
 
 
 def template_renderer(template_name: str):
@@ -467,19 +790,7 @@ def template_renderer(template_name: str):
                 # Custom rendering
                 pass
     """
-    def decorator(func):
-        @wraps(func)
-        def wrapper(self, **context):
-            return func(self, **context)
-        
-        def register_on_class(cls):
-            renderer_key = f"{cls.__name__}:{template_name}"
-            cls._template_renderers[renderer_key] = func
-            return wrapper
-        
-        wrapper._register_renderer = register_on_class  # type: ignore[attr-defined]
-        return wrapper
-    return decorator
+    return _override_decorator('_template_renderers', template_name, '_register_renderer')
 
 
 def api_client(endpoint: str):
@@ -493,19 +804,7 @@ def api_client(endpoint: str):
                 # Custom API logic
                 pass
     """
-    def decorator(func):
-        @wraps(func)
-        def wrapper(self, method, data):
-            return func(self, method, data)
-        
-        def register_on_class(cls):
-            api_key = f"{cls.__name__}:{endpoint}"
-            cls._api_clients[api_key] = func
-            return wrapper
-        
-        wrapper._register_api = register_on_class  # type: ignore[attr-defined]
-        return wrapper
-    return decorator
+    return _override_decorator('_api_clients', endpoint, '_register_api')
 
 
 def email_handler(email_type: str):
@@ -519,19 +818,7 @@ def email_handler(email_type: str):
                 # Custom email logic
                 pass
     """
-    def decorator(func):
-        @wraps(func)
-        def wrapper(self, to, subject, body):
-            return func(self, to, subject, body)
-        
-        def register_on_class(cls):
-            email_key = f"{cls.__name__}:{email_type}"
-            cls._email_handlers[email_key] = func
-            return wrapper
-        
-        wrapper._register_email = register_on_class  # type: ignore[attr-defined]
-        return wrapper
-    return decorator
+    return _override_decorator('_email_handlers', email_type, '_register_email')
 
 
 def session_handler(operation: str, key: str):
@@ -545,19 +832,7 @@ def session_handler(operation: str, key: str):
                 # Custom session logic
                 pass
     """
-    def decorator(func):
-        @wraps(func)
-        def wrapper(self, *args, **kwargs):
-            return func(self, *args, **kwargs)
-        
-        def register_on_class(cls):
-            session_key = f"{cls.__name__}:{operation}:{key}"
-            cls._session_handlers[session_key] = func
-            return wrapper
-        
-        wrapper._register_session = register_on_class  # type: ignore[attr-defined]
-        return wrapper
-    return decorator
+    return _override_decorator('_session_handlers', (operation, key), '_register_session')
 
 
 def route_handler(action: str):
@@ -570,17 +845,5 @@ def route_handler(action: str):
             def custom_show_route(self, **params):
                 return f"/custom/posts/{self.id}"
     """
-    def decorator(func):
-        @wraps(func)
-        def wrapper(self, **params):
-            return func(self, **params)
-        
-        def register_on_class(cls):
-            route_key = f"{cls.__name__}:{action}"
-            cls._route_handlers[route_key] = func
-            return wrapper
-        
-        wrapper._register_route = register_on_class  # type: ignore[attr-defined]
-        return wrapper
-    return decorator
+    return _override_decorator('_route_handlers', action, '_register_route')
 
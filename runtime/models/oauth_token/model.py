@@ -11,7 +11,7 @@ from datetime import timedelta
 class OAuthToken(Model):
     """
     Stores encrypted OAuth access and refresh tokens.
-    Tokens are encrypted at rest using Fernet symmetric encryption.
+    Tokens are encrypted at rest using AES-GCM (see auth.tokens).
     """
     
     tablename = "oauth_tokens"
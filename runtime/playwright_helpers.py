@@ -31,6 +31,11 @@ class ChromeTestHelper:
         self.context = None  # type: ignore[assignment]
         self.page = None  # type: ignore[assignment]
         
+        # Bumped by every action that can change the page; take_snapshot
+        # reuses its last result while the epoch is unchanged
+        self._nav_epoch = 0
+        self._snapshot_cache: Optional[tuple] = None
+        
     def __enter__(self):
         """Context manager entry - start browser"""
         self.start()
@@ -78,8 +83,13 @@ class ChromeTestHelper:
         )
         
         self.page = self.context.new_page()
+        self._invalidate_snapshot()
         print(f"   ✅ REAL Chrome browser started")
     
+    def _invalidate_snapshot(self) -> None:
+        """Mark the cached page snapshot stale after a page-changing action."""
+        self._nav_epoch += 1
+    
     def close(self):
         """Close the REAL browser"""
         if self.page:
@@ -107,6 +117,7 @@ class ChromeTestHelper:
         print(f"   → Navigating to: {url}")
         
         try:
+            self._invalidate_snapshot()
             self.page.goto(url, timeout=timeout, wait_until='networkidle')
             return True
         except Exception as e:
@@ -122,6 +133,10 @@ class ChromeTestHelper:
         """
         print("   → Taking page snapshot...")
         
+        cached = self._snapshot_cache
+        if cached is not None and cached[0] == self._nav_epoch:
+            return dict(cached[1])
+        
         try:
             content = self.page.content()
             title = self.page.title()
@@ -148,12 +163,14 @@ class ChromeTestHelper:
                 return elements;
             }''')
             
-            return {
+            snapshot = {
                 'content': content,
                 'title': title,
                 'url': url,
                 'elements': elements
             }
+            self._snapshot_cache = (self._nav_epoch, snapshot)
+            return dict(snapshot)
         except Exception as e:
             print(f"   ❌ Snapshot failed: {e}")
             raise
@@ -204,11 +221,51 @@ class ChromeTestHelper:
         print(f"   → Resizing viewport to {width}x{height}...")
         
         try:
+            self._invalidate_snapshot()
             self.page.set_viewport_size({"width": width, "height": height})
         except Exception as e:
             print(f"   ❌ Resize failed: {e}")
             raise
     
+    def batch_viewport_capture(
+        self,
+        path: str,
+        viewports: Dict[str, Dict[str, Any]]
+    ) -> Dict[str, str]:
+        """
+        Screenshot a page at several viewport sizes using REAL Chrome.
+        
+        The page is reloaded after every resize, so load-time layout
+        (window.innerWidth checks in scripts, srcset/<picture> selection)
+        is exercised per viewport, not just CSS reflow.
+        
+        Args:
+            path: URL path to capture
+            viewports: Mapping of viewport names to {'width', 'height', 'name'}
+            
+        Returns:
+            Dictionary mapping viewport names to screenshot paths
+            
+        Raises:
+            RuntimeError: If the page fails to load at any viewport
+        """
+        screenshots = {}
+        path_slug = path.replace('/', '_')
+        
+        for viewport_name, viewport in viewports.items():
+            print(f"\n📱 Testing {viewport['name']} ({viewport['width']}x{viewport['height']})...")
+            
+            self.resize_page(viewport['width'], viewport['height'])
+            if not self.navigate(path):
+                raise RuntimeError(f"Navigation to {path} failed at {viewport['name']} viewport")
+            
+            filename = f"{viewport_name}_{path_slug}.png"
+            screenshots[viewport_name] = self.take_screenshot(filename, full_page=False)
+            
+            print(f"   ✓ Screenshot: {filename}")
+        
+        return screenshots
+    
     def click_element(self, selector: str, double_click: bool = False) -> None:
         """
         Click an element by CSS selector using REAL Chrome.
@@ -220,6 +277,7 @@ class ChromeTestHelper:
         print(f"   → Clicking element: {selector}")
         
         try:
+            self._invalidate_snapshot()
             if double_click:
                 self.page.dblclick(selector)
             else:
@@ -239,6 +297,7 @@ class ChromeTestHelper:
         print(f"   → Filling field {selector}: {value}")
         
         try:
+            self._invalidate_snapshot()
             self.page.fill(selector, value)
         except Exception as e:
             print(f"   ❌ Fill failed: {e}")
@@ -254,6 +313,7 @@ class ChromeTestHelper:
         print(f"   → Filling {len(fields)} form fields...")
         
         try:
+            self._invalidate_snapshot()
             for field in fields:
                 selector = field.get('selector')
                 value = field.get('value', '')
@@ -274,6 +334,7 @@ class ChromeTestHelper:
         print(f"   → Hovering over: {selector}")
         
         try:
+            self._invalidate_snapshot()
             self.page.hover(selector)
         except Exception as e:
             print(f"   ❌ Hover failed: {e}")
@@ -293,6 +354,7 @@ class ChromeTestHelper:
         print(f"   → Waiting for text: '{text}'...")
         
         try:
+            self._invalidate_snapshot()
             self.page.wait_for_selector(f"text={text}", timeout=timeout)
             return True
         except Exception as e:
@@ -346,6 +408,7 @@ class ChromeTestHelper:
         
         # Playwright has built-in tracing
         try:
+            self._invalidate_snapshot()
             self.context.tracing.start(screenshots=True, snapshots=True)
             if reload:
                 self.page.reload()
@@ -415,6 +478,7 @@ class ChromeTestHelper:
         print(f"   → Opening new page: {url}")
         
         try:
+            self._invalidate_snapshot()
             new_page = self.context.new_page()
             new_page.goto(url, timeout=timeout)
         except Exception as e:
@@ -435,6 +499,7 @@ class ChromeTestHelper:
         print(f"   → Evaluating script: {script[:50]}...")
         
         try:
+            self._invalidate_snapshot()
             if args:
                 result = self.page.evaluate(script, args)
             else:
@@ -502,22 +567,4 @@ def check_viewports(helper: ChromeTestHelper, path: str = "/") -> Dict[str, str]
     Returns:
         Dictionary mapping viewport names to screenshot paths
     """
-    screenshots = {}
-    
-    for viewport_name, viewport in VIEWPORTS.items():
-        print(f"\n📱 Testing {viewport['name']} ({viewport['width']}x{viewport['height']})...")
-        
-        # Resize viewport (REAL Chrome resize)
-        helper.resize_page(viewport['width'], viewport['height'])
-        
-        # Navigate (REAL Chrome navigation)
-        helper.navigate(path)
-        
-        # Take screenshot (REAL Chrome screenshot)
-        filename = f"{viewport_name}_{path.replace('/', '_')}.png"
-        screenshot_path = helper.take_screenshot(filename, full_page=False)
-        screenshots[viewport_name] = screenshot_path
-        
-        print(f"   ✓ Screenshot: {filename}")
-    
-    return screenshots
+    return helper.batch_viewport_capture(path, VIEWPORTS)